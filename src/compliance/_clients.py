@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Per-thread shared API clients for helpers that don't receive one from their caller."""
+
+import threading
+from typing import Optional
+
+from .gh_api import GitHubAPI
+
+_tls = threading.local()
+
+
+def get_gh(org: Optional[str] = None) -> GitHubAPI:
+    """Return this thread's GitHub client, creating it on first use.
+
+    The client (and its keep-alive connections and installation token) is reused by
+    every later call on the same thread with the same ``org``.
+
+    Args:
+        org: Organization name (None = GITHUB_ORG env var)
+    """
+    client = getattr(_tls, "gh", None)
+    if client is None or _tls.gh_org != org:
+        client = _tls.gh = GitHubAPI(org=org)
+        _tls.gh_org = org
+    return client
+
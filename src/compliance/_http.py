@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Process-wide urllib3 connection pool shared by the GitHub and Notion clients."""
+
+import socket
+import threading
+from typing import Optional
+
+import urllib3
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+USER_AGENT = "de-utils-compliance/0.1.0"
+
+# Transient gateway errors are retried with backoff (0.5s, 1s, 2s). POST is left out
+# because Notion page creation isn't idempotent; connection errors are retried for every
+# method. raise_on_status=False hands the last response back so callers keep their own
+# "HTTP <status>" error handling.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "PUT", "PATCH", "DELETE"}),
+    raise_on_status=False,
+)
+
+# urllib3's defaults already disable Nagle (TCP_NODELAY), so small request bodies such as
+# Notion /pages writes go out immediately; TCP keepalive is added so idle pooled
+# connections are noticed if a middlebox drops them
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+_pool: Optional[urllib3.PoolManager] = None
+_pool_lock = threading.Lock()
+
+
+def shared_pool(maxsize: int = 32) -> urllib3.PoolManager:
+    """Return the process-wide PoolManager, creating it on first use.
+
+    Every client in the process reuses the same keep-alive connections to
+    api.github.com and api.notion.com, so TLS handshakes happen once per connection
+    rather than once per client.
+
+    Args:
+        maxsize: Keep-alive connections to keep per host; the pool grows to the
+            largest size any caller asks for
+
+    Returns:
+        Shared PoolManager
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=maxsize,
+                block=False,
+                retries=RETRY,
+                socket_options=SOCKET_OPTIONS,
+                headers={"User-Agent": USER_AGENT},
+            )
+        elif maxsize > _pool.connection_pool_kw["maxsize"]:
+            # Host pools are built from connection_pool_kw, so drop the existing
+            # (idle, at start-up) ones and let them be recreated at the new size
+            _pool.connection_pool_kw["maxsize"] = maxsize
+            _pool.clear()
+        return _pool
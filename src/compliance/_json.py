@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""JSON (de)serialization for API bodies, using orjson when it is installed."""
+
+import json
+from types import MappingProxyType
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize read-only mappings (e.g. frozen schema constants) as JSON objects."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if ORJSON_AVAILABLE:
+    def loads(data: bytes) -> Any:
+        """Parse a JSON response body straight from bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, default=_default)
+else:
+    def loads(data: bytes) -> Any:
+        """Parse a JSON response body straight from bytes."""
+        return json.loads(data.decode("utf-8"))
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes."""
+        return json.dumps(obj, default=_default).encode("utf-8")
@@ -2,35 +2,79 @@
 """CLI for running compliance audits and syncing to Notion."""
 
 import argparse
+import copy
 import json
 import os
-import signal
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields, is_dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .cache import ETagStore, ResultCache, config_fingerprint
 from .checks import ComplianceChecker
-from .gh_api import GitHubAPI
+from .gh_api import GitHubAPI, MemoizedGitHubAPI
 from .notion_api import NotionAPI
+from .notion_writer import NotionWriter
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for values the stdlib encoder doesn't know (results, datetimes)."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+def _dump_output(output: Dict[str, Any]) -> bytes:
+    """Serialize the audit output as indented JSON, using orjson when installed.
+
+    orjson serializes ``AuditResult`` dataclasses natively; the stdlib path converts them.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC, default=str)
+    return json.dumps(output, indent=2, default=_json_default).encode("utf-8")
+
+
+# Parsed configs keyed by (path, mtime) so repeated loads skip YAML parsing
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _load_yaml_file(path: str) -> Dict[str, Any]:
+    """Parse a YAML file with the libyaml loader, reusing the last parse if unchanged."""
+    key = (os.fspath(path), os.path.getmtime(path))
+    if key not in _CONFIG_CACHE:
+        with open(path, "r") as f:
+            _CONFIG_CACHE[key] = yaml.load(f, Loader=SafeLoader) or {}
+    # Callers mutate the config (e.g. CLI overrides), so never hand out the cached object
+    return copy.deepcopy(_CONFIG_CACHE[key])
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from YAML file."""
     if config_path and os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml_file(config_path)
 
     # Try default location
     default_path = Path(__file__).parent / "config.yaml"
     if default_path.exists():
-        with open(default_path, "r") as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml_file(default_path)
 
     return {}
 
@@ -40,9 +84,37 @@ class TimeoutError(Exception):
     pass
 
 
-def timeout_handler(signum, frame):
-    """Handle timeout signal."""
-    raise TimeoutError("Audit timed out after 15 minutes")
+@dataclass(frozen=True, slots=True)
+class AuditResult:
+    """Outcome of auditing one repository.
+
+    Slotted so a large run holds one compact object per repo instead of a dict; use
+    ``asdict`` (or ``to_dict``) where a plain dict is needed, e.g. for the result cache.
+    """
+
+    repo: str
+    name: str
+    default_branch: str
+    archived: bool
+    archived_at: Optional[str]
+    forked: bool
+    primary_language: Optional[str]
+    primary_contributor: Optional[str]
+    contributors_count: Optional[int]
+    last_commit_date: Optional[str]
+    time_since_last_commit: Optional[str]
+    compliance_score: Optional[float]  # None: checks skipped and no earlier score known
+    checks: Dict[str, Any]
+    audit_timestamp: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a plain dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditResult":
+        """Build a result from a dict, e.g. one read back from the result cache."""
+        return cls(**{f.name: data.get(f.name) for f in fields(cls)})
 
 
 def audit_repo(
@@ -54,257 +126,431 @@ def audit_repo(
     progress: Optional[tuple[int, int]] = None,
     skip_recent_hours: Optional[int] = None,
     timeout_minutes: int = 30,
-    include_properties: Optional[List[str]] = None,
-    exclude_properties: Optional[List[str]] = None,
+    include_properties: Optional[Iterable[str]] = None,
+    exclude_properties: Optional[Iterable[str]] = None,
     min_score: Optional[float] = None,
     max_score: Optional[float] = None,
-) -> Optional[Dict[str, Any]]:
+    result_cache: Optional[ResultCache] = None,
+    notion_snapshot: Optional[Dict[str, Dict[str, Any]]] = None,
+    audit_ts: Optional[datetime] = None,
+    use_graphql: bool = False,
+) -> Optional[AuditResult]:
     """Audit a single repository.
 
+    Syncing the result to Notion is left to the caller (see ``NotionWriter``).
+
     Args:
         gh_api: GitHub API client
         checker: Compliance checker
-        notion_api: Optional Notion API client
+        notion_api: Optional Notion API client (used to skip recently audited repos)
         repo_name: Repository name
         scorecard_db_id: Optional Notion database ID for scorecard
         progress: Optional tuple of (current, total) for progress display
         skip_recent_hours: Skip if audited within this many hours (None = don't skip)
         timeout_minutes: Maximum time to spend auditing this repo (default: 30)
-        include_properties: List of properties to include (None = all)
-        exclude_properties: List of properties to exclude (None = none)
+        include_properties: Properties to include (None = all)
+        exclude_properties: Properties to exclude (None = none)
         min_score: Minimum compliance score to process (None = no minimum)
         max_score: Maximum compliance score to process (None = no maximum)
+        result_cache: Optional cache of previous results keyed by default-branch HEAD SHA
+        notion_snapshot: Optional pre-fetched scorecard pages from NotionAPI.snapshot_database
+                         (None = look the page up in Notion)
+        audit_ts: Timestamp shared by every repo in the run, also the reference time for
+                  skip_recent_hours (None = now)
+        use_graphql: Gather the check data with one GraphQL query (falls back to REST on error)
 
     Returns:
-        Audit results dict, or None if skipped/timed out
+        Audit result, or None if skipped/timed out
     """
-    # Set up timeout
-    start_time = time.time()
-    timeout_seconds = timeout_minutes * 60
+    if audit_ts is None:
+        audit_ts = datetime.now(timezone.utc)
+
+    # Hash-set lookups for the property filters (no-op if already frozensets)
+    include_set = frozenset(include_properties) if include_properties is not None else None
+    exclude_set = frozenset(exclude_properties) if exclude_properties is not None else None
+
+    # Set up timeout (monotonic so wall-clock adjustments can't trigger or mask it)
+    deadline = time.monotonic() + timeout_minutes * 60
 
     def check_timeout():
-        elapsed = time.time() - start_time
-        if elapsed > timeout_seconds:
+        if time.monotonic() > deadline:
             raise TimeoutError(f"Audit timed out after {timeout_minutes} minutes")
+
     # Check if we should skip recently audited repos
     if skip_recent_hours and notion_api and scorecard_db_id:
-        existing_page = notion_api.find_page_by_title(scorecard_db_id, repo_name)
+        existing_page = _find_scorecard_page(
+            notion_api, scorecard_db_id, repo_name, notion_snapshot
+        )
         if existing_page:
-            last_audit_prop = existing_page.get("properties", {}).get("Last Audit", {})
-            last_audit_date = last_audit_prop.get("date", {}).get("start")
+            last_audit_date = existing_page["last_audit"]
             if last_audit_date:
                 try:
                     last_audit = datetime.fromisoformat(last_audit_date.replace("Z", "+00:00"))
-                    hours_since_audit = (datetime.now(timezone.utc) - last_audit).total_seconds() / 3600
+                    hours_since_audit = (audit_ts - last_audit).total_seconds() / 3600
                     if hours_since_audit < skip_recent_hours:
                         # Progress handled by main thread in parallel mode
                         return None
                 except (ValueError, AttributeError):
                     pass  # If we can't parse the date, proceed with audit
 
+    # Progress tags are buffered and written with a single call when the audit ends, so
+    # concurrent workers don't contend on (or interleave within) stderr tag by tag
     if progress:
         current, total = progress
-        print(f"[{current}/{total}] Auditing {repo_name}...", file=sys.stderr, end="", flush=True)
+        phases = [f"[{current}/{total}] Auditing {repo_name}..."]
     else:
-        print(f"Auditing {repo_name}...", file=sys.stderr, end="", flush=True)
-
-    # Get repo data
-    print(" [fetching repo data]", file=sys.stderr, end="", flush=True)
-    repo_data = gh_api.get_repo(repo_name)
-    full_name = repo_data.get("full_name", repo_name)
-    default_branch = repo_data.get("default_branch", "main")
-    archived = repo_data.get("archived", False)
-    forked = repo_data.get("fork", False)
-
-    # Helper function to check if property should be included
-    def should_include_property(prop_name: str) -> bool:
-        """Check if property should be included based on include/exclude lists."""
-        if include_properties is not None:
-            if prop_name not in include_properties:
-                return False
-        if exclude_properties is not None:
-            if prop_name in exclude_properties:
-                return False
-        return True
+        phases = [f"Auditing {repo_name}..."]
 
-    # Get languages
-    primary_language = None
-    if should_include_property("primary_language"):
-        print(" [languages]", file=sys.stderr, end="", flush=True)
-        languages = gh_api.get_repo_languages(repo_name)
-        primary_language = checker.get_primary_language(languages)
-
-    # Get latest commit
-    last_commit_date = None
-    time_since_last_commit = None
-    if should_include_property("last_commit_date") or should_include_property("time_since_last_commit"):
-        print(" [commits]", file=sys.stderr, end="", flush=True)
-        check_timeout()
-        latest_commit = gh_api.get_latest_commit(repo_name, default_branch)
-        if latest_commit:
-            commit_data = latest_commit.get("commit", {})
-            author_data = commit_data.get("author", {})
-            date_str = author_data.get("date")
-            if date_str:
+    try:
+        # Get repo data
+        phases.append(" [fetching repo data]")
+        repo_data = gh_api.get_repo(repo_name)
+        full_name = repo_data.get("full_name", repo_name)
+        default_branch = repo_data.get("default_branch", "main")
+        archived = repo_data.get("archived", False)
+        forked = repo_data.get("fork", False)
+
+        # Archived repos are read-only and forks may be out of scope: skip every follow-up call
+        if (archived and not checker.config.get("audit_archived", False)) or (
+            forked and checker.config.get("skip_forks", False)
+        ):
+            phases.append(" [archived]" if archived else " [fork]")
+            result = _minimal_result(repo_data, full_name, default_branch, audit_ts, result_cache)
+            if not _within_score_range(
+                result.compliance_score, min_score, max_score, phases if progress else None
+            ):
+                return None
+            if not progress:
+                phases.append(
+                    f" ✓ (score: {_format_score(result.compliance_score)}, checks skipped)"
+                )
+            return result
+
+        # Reuse the previous result if the default branch hasn't moved since it was audited
+        head_sha = None
+        if result_cache is not None:
+            head_commit = gh_api.get_latest_commit(repo_name, default_branch)
+            head_sha = head_commit.get("sha") if head_commit else None
+            cached = result_cache.get(full_name, head_sha) if head_sha else None
+            if cached is not None:
+                phases.append(" [cached]")
+                cached_result = _refresh_cached_result(
+                    checker, repo_name, repo_data, AuditResult.from_dict(cached), audit_ts
+                )
+                if not _within_score_range(
+                    cached_result.compliance_score,
+                    min_score,
+                    max_score,
+                    phases if progress else None,
+                ):
+                    return None
+                if not progress:
+                    phases.append(f" ✓ (score: {cached_result.compliance_score:.1f})")
+                return cached_result
+
+        # Get languages
+        primary_language = None
+        if _should_include_property("primary_language", include_set, exclude_set):
+            phases.append(" [languages]")
+            languages = gh_api.get_repo_languages(repo_name)
+            primary_language = checker.get_primary_language(languages)
+
+        # Get latest commit
+        last_commit_date = None
+        time_since_last_commit = None
+        if _should_include_property(
+            "last_commit_date", include_set, exclude_set
+        ) or _should_include_property("time_since_last_commit", include_set, exclude_set):
+            phases.append(" [commits]")
+            check_timeout()
+            latest_commit = gh_api.get_latest_commit(repo_name, default_branch)
+            if latest_commit:
+                commit_data = latest_commit.get("commit", {})
+                author_data = commit_data.get("author", {})
+                date_str = author_data.get("date")
+                if date_str:
+                    try:
+                        last_commit_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                        time_since_last_commit = checker.humanize_time_since(last_commit_date)
+                    except (ValueError, AttributeError):
+                        pass
+
+        # Get contributors (only if needed)
+        primary_contributor = None
+        contributors_count = None
+        if _should_include_property(
+            "primary_contributor", include_set, exclude_set
+        ) or _should_include_property("contributors_count", include_set, exclude_set):
+            phases.append(" [contributors]")
+            # Count over the wider window first; the primary contributor's narrower
+            # window is then filtered from the same commits instead of refetched
+            check_timeout()
+            if _should_include_property("contributors_count", include_set, exclude_set):
                 try:
-                    last_commit_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    time_since_last_commit = checker.humanize_time_since(last_commit_date)
-                except (ValueError, AttributeError):
-                    pass
-
-    # Get contributors (only if needed)
-    primary_contributor = None
-    contributors_count = None
-    if should_include_property("primary_contributor") or should_include_property("contributors_count"):
-        print(" [contributors]", file=sys.stderr, end="", flush=True)
+                    contributors_count = checker.get_contributors_count(repo_name)
+                except TimeoutError:
+                    phases.append(" ⚠ Timeout getting contributors count")
+                    contributors_count = 0
+                    raise  # Re-raise to exit audit
+
+            check_timeout()
+            if _should_include_property("primary_contributor", include_set, exclude_set):
+                try:
+                    primary_contributor_result = checker.get_primary_contributor(repo_name)
+                    primary_contributor = (
+                        primary_contributor_result[0] if primary_contributor_result else None
+                    )
+                except TimeoutError:
+                    phases.append(" ⚠ Timeout getting primary contributor")
+                    primary_contributor = None
+                    raise  # Re-raise to exit audit
+
+        # Run compliance checks
+        phases.append(" [checks]")
         check_timeout()
-        if should_include_property("primary_contributor"):
+        # Check if repo allows release branches (e.g., IaC repos)
+        allow_release_branches = checker.config.get("allow_release_branches") or []
+        allow_release = repo_name in allow_release_branches
+        checks = None
+        if use_graphql:
             try:
-                primary_contributor_result = checker.get_primary_contributor(repo_name)
-                primary_contributor = primary_contributor_result[0] if primary_contributor_result else None
-            except TimeoutError:
-                print(f" ⚠ Timeout getting primary contributor", file=sys.stderr)
-                primary_contributor = None
-                raise  # Re-raise to exit audit
-
+                checks = checker.check_all_via_graphql(
+                    repo_name, repo_data, allow_release_branches=allow_release
+                )
+            except Exception as e:
+                phases.append(f" [graphql failed, using REST: {e}]")
+        if checks is None:
+            # The independent check requests run concurrently
+            checks = checker.run_all_checks(
+                repo_name, repo_data, allow_release_branches=allow_release
+            )
         check_timeout()
-        if should_include_property("contributors_count"):
-            try:
-                contributors_count = checker.get_contributors_count(repo_name)
-            except TimeoutError:
-                print(f" ⚠ Timeout getting contributors count", file=sys.stderr)
-                contributors_count = 0
-                raise  # Re-raise to exit audit
-
-    # Run compliance checks
-    print(" [checks]", file=sys.stderr, end="", flush=True)
-    check_timeout()
-    default_branch_compliant, default_branch_msg = checker.check_default_branch(repo_data)
-    branch_protection = checker.check_branch_protection(repo_name, default_branch)
-
-    check_timeout()
-    branches = gh_api.list_branches(repo_name)
-    # Check if repo allows release branches (e.g., IaC repos)
-    allow_release_branches = checker.config.get("allow_release_branches") or []
-    allow_release = repo_name in allow_release_branches
-    branch_naming = checker.check_branch_naming(branches, allow_release_branches=allow_release)
-
-    check_timeout()
-    standard_files = checker.check_standard_files(repo_name, default_branch)
-    ci_patterns = checker.check_ci_patterns(repo_name)
-    stale_branches = checker.check_stale_branches(branches)
-
-    # Compile checks
-    checks = {
-        "default_branch_compliant": default_branch_compliant,
-        "default_branch_message": default_branch_msg,
-        "branch_protection": branch_protection,
-        "branch_naming": branch_naming,
-        "standard_files": standard_files,
-        "ci_patterns": ci_patterns,
-        "stale_branches": stale_branches,
-    }
 
-    # Compute score
-    compliance_score = checker.compute_compliance_score(checks)
+        # Compute score
+        compliance_score = checker.compute_compliance_score(checks)
+
+        # Build result
+        result = AuditResult(
+            repo=full_name,
+            name=repo_data.get("name", ""),
+            default_branch=default_branch,
+            archived=archived,
+            archived_at=repo_data.get("archived_at"),
+            forked=forked,
+            primary_language=primary_language,
+            primary_contributor=primary_contributor,
+            contributors_count=contributors_count,
+            last_commit_date=last_commit_date.isoformat() if last_commit_date else None,
+            time_since_last_commit=time_since_last_commit,
+            compliance_score=compliance_score,
+            checks=checks,
+            audit_timestamp=audit_ts.isoformat(),
+        )
+
+        # Cache before score filtering so later runs with other thresholds can reuse it
+        if result_cache is not None and head_sha:
+            result_cache.put(full_name, head_sha, result.to_dict())
+
+        # Check score thresholds
+        if not _within_score_range(
+            compliance_score, min_score, max_score, phases if progress else None
+        ):
+            return None
+
+        # Progress and score reporting handled by main thread in parallel mode
+        if not progress:
+            phases.append(f" ✓ (score: {compliance_score:.1f})")
+        return result
+    finally:
+        sys.stderr.write("".join(phases) + "\n")
+
+
+def _refresh_cached_result(
+    checker: ComplianceChecker,
+    repo_name: str,
+    repo_data: Dict[str, Any],
+    cached: AuditResult,
+    audit_ts: datetime,
+) -> AuditResult:
+    """Bring a result cached for the current default-branch HEAD up to date.
+
+    Everything derived from commits and files at that HEAD is reused. Branch protection,
+    the branch naming and stale-branch checks, and the humanized time since the last
+    commit can change without the HEAD moving, so they are recomputed (and the score
+    with them). The result is stamped with this run's audit timestamp.
+    """
+    allow_release = repo_name in (checker.config.get("allow_release_branches") or [])
+    checks = checker.refresh_checks(
+        repo_name, repo_data, cached.checks, allow_release_branches=allow_release
+    )
+
+    time_since_last_commit = cached.time_since_last_commit
+    if cached.last_commit_date:
+        time_since_last_commit = checker.humanize_time_since(
+            datetime.fromisoformat(cached.last_commit_date)
+        )
+
+    return replace(
+        cached,
+        time_since_last_commit=time_since_last_commit,
+        compliance_score=checker.compute_compliance_score(checks),
+        checks=checks,
+        audit_timestamp=audit_ts.isoformat(),
+    )
+
+
+def _minimal_result(
+    repo_data: Dict[str, Any],
+    full_name: str,
+    default_branch: str,
+    audit_ts: datetime,
+    result_cache: Optional[ResultCache] = None,
+) -> AuditResult:
+    """Build a result for a repo whose checks are skipped (archived or fork).
+
+    The compliance score is carried over from the repo's last cached audit, if any. Without
+    one it is None, so Notion's Compliance Score column keeps whatever it already holds.
+    """
+    prior = result_cache.last_result(full_name) if result_cache is not None else None
+    return AuditResult(
+        repo=full_name,
+        name=repo_data.get("name", ""),
+        default_branch=default_branch,
+        archived=repo_data.get("archived", False),
+        archived_at=repo_data.get("archived_at"),
+        forked=repo_data.get("fork", False),
+        primary_language=None,
+        primary_contributor=None,
+        contributors_count=None,
+        last_commit_date=None,
+        time_since_last_commit=None,
+        compliance_score=prior["compliance_score"] if prior else None,
+        checks={},
+        audit_timestamp=audit_ts.isoformat(),
+    )
+
+
+def _should_include_property(
+    prop_name: str,
+    include_set: Optional[FrozenSet[str]],
+    exclude_set: Optional[FrozenSet[str]],
+) -> bool:
+    """Check if property should be included based on include/exclude sets."""
+    if include_set is not None and prop_name not in include_set:
+        return False
+    if exclude_set is not None and prop_name in exclude_set:
+        return False
+    return True
+
+
+def _find_scorecard_page(
+    notion_api: NotionAPI,
+    database_id: str,
+    repo_name: str,
+    snapshot: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Look up a repo's scorecard page, preferring the pre-fetched snapshot.
+
+    Returns:
+        {"id": page_id, "last_audit": iso_str or None}, or None if the repo has no page
+    """
+    if snapshot is not None:
+        return snapshot.get(repo_name.lower())
+    page = notion_api.find_page_by_title(database_id, repo_name)
+    return NotionAPI.summarize_page(page)[1] if page else None
+
+
+def _format_score(compliance_score: Optional[float]) -> str:
+    """Format a compliance score for progress output ("n/a" if unknown)."""
+    return "n/a" if compliance_score is None else f"{compliance_score:.1f}"
+
+
+def _within_score_range(
+    compliance_score: Optional[float],
+    min_score: Optional[float],
+    max_score: Optional[float],
+    phases: Optional[List[str]] = None,
+) -> bool:
+    """Check a compliance score against the optional min/max thresholds.
 
-    # Check score thresholds
+    An unknown (None) score is not filtered. If ``phases`` is given, a skip note is
+    appended to it for progress output.
+    """
+    if compliance_score is None:
+        return True
     if min_score is not None and compliance_score < min_score:
-        if progress:
-            current, total = progress
-            print(f" [score {compliance_score:.1f} < {min_score}, skipping]", file=sys.stderr)
-        return None
+        if phases is not None:
+            phases.append(f" [score {compliance_score:.1f} < {min_score}, skipping]")
+        return False
     if max_score is not None and compliance_score > max_score:
-        if progress:
-            current, total = progress
-            print(f" [score {compliance_score:.1f} > {max_score}, skipping]", file=sys.stderr)
-        return None
-
-    # Build result
-    result = {
-        "repo": full_name,
-        "name": repo_data.get("name", ""),
-        "default_branch": default_branch,
-        "archived": archived,
-        "archived_at": repo_data.get("archived_at"),
-        "forked": forked,
-        "primary_language": primary_language,
-        "primary_contributor": primary_contributor,
-        "contributors_count": contributors_count,
-        "last_commit_date": last_commit_date.isoformat() if last_commit_date else None,
-        "time_since_last_commit": time_since_last_commit,
-        "compliance_score": compliance_score,
-        "checks": checks,
-        "audit_timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+        if phases is not None:
+            phases.append(f" [score {compliance_score:.1f} > {max_score}, skipping]")
+        return False
+    return True
 
-    # Sync to Notion if configured
-    if notion_api and scorecard_db_id:
-        print(" [syncing]", file=sys.stderr, end="", flush=True)
-        check_timeout()
-        sync_to_notion(notion_api, scorecard_db_id, result, include_properties=include_properties, exclude_properties=exclude_properties)
 
-    # Progress and score reporting handled by main thread in parallel mode
-    if not progress:
-        print(f" ✓ (score: {compliance_score:.1f})", file=sys.stderr)
-    return result
+@dataclass(frozen=True, slots=True)
+class AuditContext:
+    """Settings and shared clients common to every repository audit in a run.
+
+    Built once in ``main`` and shared by all worker tasks, which only add the repo name.
+    """
+
+    config: Dict[str, Any]
+    gh_api: GitHubAPI
+    notion_api: Optional[NotionAPI]
+    scorecard_db_id: Optional[str]
+    skip_hours: Optional[int]
+    timeout_minutes: int
+    include_properties: Optional[FrozenSet[str]]
+    exclude_properties: Optional[FrozenSet[str]]
+    min_score: Optional[float]
+    max_score: Optional[float]
+    result_cache: Optional[ResultCache] = None
+    notion_snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+    audit_ts: Optional[datetime] = None
+    use_graphql: bool = False
 
 
 def audit_repo_wrapper(
-    args_tuple: tuple,
-) -> tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    ctx: AuditContext,
+    repo_name: str,
+) -> tuple[str, Optional[AuditResult], Optional[str]]:
     """Wrapper function for parallel execution of audit_repo.
 
+    The GitHub and Notion clients on the context are shared by all workers so that every
+    audit reuses the same pooled keep-alive connections instead of opening its own TLS sessions.
+
     Args:
-        args_tuple: Tuple of (repo_name, config_dict, org, scorecard_db_id, skip_hours,
-                   timeout_minutes, include_properties, exclude_properties, min_score, max_score, dry_run)
+        ctx: Run-wide audit settings and clients
+        repo_name: Repository to audit
 
     Returns:
-        Tuple of (repo_name, result_dict, error_type) where error_type is None, 'timeout', or 'error'
+        Tuple of (repo_name, result, error_type) where error_type is None, 'timeout', or 'error'
     """
-    (
-        repo_name,
-        config,
-        org,
-        scorecard_db_id,
-        skip_hours,
-        timeout_minutes,
-        include_properties,
-        exclude_properties,
-        min_score,
-        max_score,
-        dry_run,
-    ) = args_tuple
-
-    # Create new API instances for this thread
-    try:
-        gh_api = GitHubAPI(org=org)
-    except ValueError as e:
-        return (repo_name, None, f"API init error: {e}")
-
-    checker = ComplianceChecker(gh_api, config)
-
-    notion_api = None
-    if not dry_run:
-        try:
-            notion_api = NotionAPI()
-        except ValueError:
-            pass  # Notion not available, continue without sync
+    # Memoize lookups for the lifetime of this audit so the checker and audit_repo
+    # never fetch the same resource twice; the checker is cheap, so keep one per audit
+    repo_api = MemoizedGitHubAPI(ctx.gh_api)
+    checker = ComplianceChecker(repo_api, ctx.config)
 
     try:
         result = audit_repo(
-            gh_api,
+            repo_api,
             checker,
-            notion_api,
+            ctx.notion_api,
             repo_name,
-            scorecard_db_id,
+            ctx.scorecard_db_id,
             progress=None,  # Progress handled by main thread
-            skip_recent_hours=skip_hours,
-            timeout_minutes=timeout_minutes,
-            include_properties=include_properties,
-            exclude_properties=exclude_properties,
-            min_score=min_score,
-            max_score=max_score,
+            skip_recent_hours=ctx.skip_hours,
+            timeout_minutes=ctx.timeout_minutes,
+            include_properties=ctx.include_properties,
+            exclude_properties=ctx.exclude_properties,
+            min_score=ctx.min_score,
+            max_score=ctx.max_score,
+            result_cache=ctx.result_cache,
+            notion_snapshot=ctx.notion_snapshot,
+            audit_ts=ctx.audit_ts,
+            use_graphql=ctx.use_graphql,
         )
         return (repo_name, result, None)
     except TimeoutError as e:
@@ -313,91 +559,102 @@ def audit_repo_wrapper(
         return (repo_name, None, f"error: {str(e)}")
 
 
+# Scorecard columns synced from a result: (result key, Notion property, builder, guard).
+# A property is written only if the guard accepts the result value and the filters allow it.
+# Builders emit the Notion property JSON directly (same shapes as NotionAPI.property_*),
+# so the per-row write path takes no extra call per field.
+_PROP_BUILDERS = (
+    ("compliance_score", "Compliance Score", lambda v: {"number": v}, lambda v: v is not None),
+    (
+        "default_branch",
+        "Default Branch",
+        lambda v: {"rich_text": [{"text": {"content": v}}]},
+        lambda v: True,
+    ),
+    ("archived", "Archived", lambda v: {"checkbox": v}, lambda v: True),
+    ("forked", "Forked", lambda v: {"checkbox": bool(v)}, lambda v: True),
+    (
+        "primary_language",
+        "Primary Language",
+        lambda v: {"rich_text": [{"text": {"content": v}}]},
+        bool,
+    ),
+    (
+        "primary_contributor",
+        "Primary Contributor",
+        lambda v: {"rich_text": [{"text": {"content": v or "Unknown"}}]},
+        lambda v: v is not None,
+    ),
+    ("contributors_count", "Contributors Count", lambda v: {"number": v}, lambda v: v is not None),
+    ("last_commit_date", "Last Commit Date", lambda v: {"date": {"start": v}}, bool),  # ISO 8601
+    (
+        "time_since_last_commit",
+        "Time Since Last Commit",
+        lambda v: {"rich_text": [{"text": {"content": v}}]},
+        bool,
+    ),
+)
+
+
+@lru_cache(maxsize=None)
+def _synced_columns(
+    include_set: Optional[FrozenSet[str]],
+    exclude_set: Optional[FrozenSet[str]],
+) -> tuple:
+    """The _PROP_BUILDERS rows allowed by the property filters, computed once per filter pair."""
+    return tuple(
+        row for row in _PROP_BUILDERS if _should_include_property(row[0], include_set, exclude_set)
+    )
+
+
 def sync_to_notion(
     notion_api: NotionAPI,
     database_id: str,
-    result: Dict[str, Any],
-    include_properties: Optional[List[str]] = None,
-    exclude_properties: Optional[List[str]] = None,
+    result: AuditResult,
+    include_properties: Optional[Iterable[str]] = None,
+    exclude_properties: Optional[Iterable[str]] = None,
+    snapshot: Optional[Dict[str, Dict[str, Any]]] = None,
+    audit_ts: Optional[datetime] = None,
 ) -> None:
     """Sync audit result to Notion database.
 
     Args:
         notion_api: Notion API client
         database_id: Notion database ID
-        result: Audit result dict
-        include_properties: List of properties to include (None = all)
-        exclude_properties: List of properties to exclude (None = none)
+        result: Audit result
+        include_properties: Properties to include (None = all)
+        exclude_properties: Properties to exclude (None = none)
+        snapshot: Optional pre-fetched scorecard pages (None = look the page up in Notion)
+        audit_ts: The result's audit timestamp as a datetime (None = parse result.audit_timestamp)
     """
-    repo_name = result["repo"]
+    repo_name = result.repo
 
     # Check if page exists
-    existing_page = notion_api.find_page_by_title(database_id, repo_name)
-
-    # Property mapping: result key -> Notion property name
-    property_mapping = {
-        "primary_language": "Primary Language",
-        "primary_contributor": "Primary Contributor",
-        "contributors_count": "Contributors Count",
-        "last_commit_date": "Last Commit Date",
-        "time_since_last_commit": "Time Since Last Commit",
-        "default_branch": "Default Branch",
-        "archived": "Archived",
-        "compliance_score": "Compliance Score",
-    }
+    existing_page = _find_scorecard_page(notion_api, database_id, repo_name, snapshot)
 
-    def should_include_property(prop_key: str) -> bool:
-        """Check if property should be included."""
-        if include_properties is not None:
-            if prop_key not in include_properties:
-                return False
-        if exclude_properties is not None:
-            if prop_key in exclude_properties:
-                return False
-        return True
+    include_set = frozenset(include_properties) if include_properties is not None else None
+    exclude_set = frozenset(exclude_properties) if exclude_properties is not None else None
+
+    if audit_ts is None:
+        audit_ts = datetime.fromisoformat(result.audit_timestamp)
 
     # Build properties dict
     properties = {
-        "Name": notion_api.property_text(repo_name),  # Always include Name
-        "Last Audit": notion_api.property_date(datetime.fromisoformat(result["audit_timestamp"])),  # Always include Last Audit
+        "Name": {"title": [{"text": {"content": repo_name}}]},  # Always include Name
+        "Last Audit": {"date": {"start": audit_ts.isoformat()}},  # Always include Last Audit
     }
-
-    # Add compliance score (always include for filtering)
-    if should_include_property("compliance_score"):
-        properties["Compliance Score"] = notion_api.property_number(result["compliance_score"])
-
-    # Add other properties conditionally
-    if should_include_property("default_branch"):
-        properties["Default Branch"] = notion_api.property_rich_text(result["default_branch"])
-
-    if should_include_property("archived"):
-        properties["Archived"] = notion_api.property_checkbox(result["archived"])
-
-    if should_include_property("forked"):
-        properties["Forked"] = notion_api.property_checkbox(result.get("forked", False))
-
-    if should_include_property("primary_language") and result.get("primary_language"):
-        properties["Primary Language"] = notion_api.property_rich_text(result["primary_language"] or "Unknown")
-
-    if should_include_property("primary_contributor") and result.get("primary_contributor") is not None:
-        properties["Primary Contributor"] = notion_api.property_rich_text(result["primary_contributor"] or "Unknown")
-
-    if should_include_property("contributors_count") and result.get("contributors_count") is not None:
-        properties["Contributors Count"] = notion_api.property_number(result["contributors_count"])
-
-    if should_include_property("last_commit_date") and result.get("last_commit_date"):
-        properties["Last Commit Date"] = notion_api.property_date(datetime.fromisoformat(result["last_commit_date"]))
-
-    if should_include_property("time_since_last_commit") and result.get("time_since_last_commit"):
-        properties["Time Since Last Commit"] = notion_api.property_rich_text(result["time_since_last_commit"] or "Unknown")
-
-    # Remove None values
-    properties = {k: v for k, v in properties.items() if v is not None}
+    properties.update(
+        (notion_name, build(value))
+        for key, notion_name, build, guard in _synced_columns(include_set, exclude_set)
+        if guard(value := getattr(result, key))
+    )
 
     if existing_page:
         notion_api.update_page(existing_page["id"], properties)
     else:
-        notion_api.create_page(database_id, properties)
+        page = notion_api.create_page(database_id, properties)
+        if snapshot is not None:
+            snapshot[repo_name.lower()] = NotionAPI.summarize_page(page)[1]
 
 
 def main():
@@ -417,6 +674,33 @@ def main():
     parser.add_argument("--contributor-window-days", type=int, help="Override contributor window days (default: from config or 365)")
     parser.add_argument("--primary-contributor-window-days", type=int, help="Override primary contributor window days (default: from config or 90)")
     parser.add_argument("--max-workers", type=int, default=4, help="Maximum number of parallel workers (default: 4)")
+    parser.add_argument(
+        "--cache-file",
+        help="Path to the audit result cache "
+        "(default: ~/.cache/de-utils-compliance/audit-cache.sqlite3)",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=168,
+        help="Re-audit cached repos older than this many hours even if unchanged (default: 168)",
+    )
+    parser.add_argument(
+        "--etag-cache-file",
+        help="Path to the GitHub ETag cache "
+        "(default: ~/.cache/de-utils-compliance/etag-cache.sqlite3)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the audit result or ETag caches",
+    )
+    parser.add_argument(
+        "--graphql",
+        action="store_true",
+        help="Fetch each repo's check data with a single GraphQL query "
+        "(falls back to REST on error)",
+    )
 
     args = parser.parse_args()
 
@@ -429,9 +713,19 @@ def main():
     if args.primary_contributor_window_days is not None:
         config["primary_contributor_window_days"] = args.primary_contributor_window_days
 
-    # Initialize APIs
+    max_workers = args.max_workers
+
+    # Conditional requests let unchanged GitHub resources come back as free 304s
+    etag_store = None if args.no_cache else ETagStore(args.etag_cache_file)
+
+    # Initialize APIs once; all workers share these clients and their connection pools
     try:
-        gh_api = GitHubAPI(org=args.org or config.get("github_org"))
+        # Each worker may fetch up to MAX_PAGE_WORKERS list pages at once
+        gh_api = GitHubAPI(
+            org=args.org or config.get("github_org"),
+            pool_maxsize=max_workers * GitHubAPI.MAX_PAGE_WORKERS,
+            etag_store=etag_store,
+        )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -439,23 +733,45 @@ def main():
     checker = ComplianceChecker(gh_api, config)
 
     # Parse property lists
+    # Parsed straight into frozensets shared by every audit task
     include_properties = None
     if args.include_properties:
-        include_properties = [p.strip() for p in args.include_properties.split(",")]
+        include_properties = frozenset(p.strip() for p in args.include_properties.split(","))
 
     exclude_properties = None
     if args.exclude_properties:
-        exclude_properties = [p.strip() for p in args.exclude_properties.split(",")]
+        exclude_properties = frozenset(p.strip() for p in args.exclude_properties.split(","))
 
     notion_api = None
     if not args.dry_run:
         try:
-            notion_api = NotionAPI()
+            notion_api = NotionAPI(pool_maxsize=max_workers)
         except ValueError:
             print("Warning: Notion token not found, skipping Notion sync", file=sys.stderr)
 
     scorecard_db_id = args.notion_db or config.get("notion", {}).get("scorecard_db_id")
 
+    # Results are only reused when the config and property filters are unchanged
+    result_cache = None
+    if not args.no_cache:
+        result_cache = ResultCache(
+            args.cache_file,
+            config_hash=config_fingerprint(
+                config,
+                sorted(include_properties) if include_properties is not None else None,
+                sorted(exclude_properties) if exclude_properties is not None else None,
+            ),
+            ttl_hours=args.cache_ttl_hours,
+        )
+
+    # Fetch the whole scorecard once instead of querying Notion for every repo
+    notion_snapshot = None
+    if notion_api and scorecard_db_id:
+        notion_snapshot = notion_api.snapshot_database(scorecard_db_id)
+        print(
+            f"Loaded {len(notion_snapshot)} existing scorecard pages from Notion", file=sys.stderr
+        )
+
     # Check rate limit status
     try:
         # Access the private method to check rate limits
@@ -493,35 +809,52 @@ def main():
             completed_count[0] += 1
             current = completed_count[0]
             status_str = f" [{status}]" if status else ""
-            print(f"[{current}/{total}] {repo_name}{status_str}", file=sys.stderr, flush=True)
-
-    # Prepare arguments for parallel execution
-    audit_args = [
-        (
-            repo,
-            config,
-            args.org or config.get("github_org"),
-            scorecard_db_id,
-            skip_hours,
-            30,  # Timeout: 30 minutes per repository
-            include_properties,
-            exclude_properties,
-            args.min_score,
-            args.max_score,
-            args.dry_run,
+            print(f"[{current}/{total}] {repo_name}{status_str}", file=sys.stderr)
+
+    # One timestamp for the whole batch, so every row of a run carries the same audit time
+    audit_ts = datetime.now(timezone.utc)
+
+    # Shared, immutable settings for every audit task
+    ctx = AuditContext(
+        config=config,
+        gh_api=gh_api,
+        notion_api=notion_api,
+        scorecard_db_id=scorecard_db_id,
+        skip_hours=skip_hours,
+        timeout_minutes=30,  # Timeout: 30 minutes per repository
+        include_properties=include_properties,
+        exclude_properties=exclude_properties,
+        min_score=args.min_score,
+        max_score=args.max_score,
+        result_cache=result_cache,
+        notion_snapshot=notion_snapshot,
+        audit_ts=audit_ts,
+        use_graphql=args.graphql,
+    )
+
+    # Notion upserts run on their own rate-limited writer threads, off the audit workers
+    notion_writer = None
+    if notion_api and scorecard_db_id:
+        notion_writer = NotionWriter(
+            lambda r: sync_to_notion(
+                notion_api,
+                scorecard_db_id,
+                r,
+                include_properties=include_properties,
+                exclude_properties=exclude_properties,
+                snapshot=notion_snapshot,
+                audit_ts=audit_ts,
+            )
         )
-        for repo in repos
-    ]
 
     # Execute audits in parallel
-    max_workers = args.max_workers
     print(f"Processing {total} repositories with {max_workers} parallel workers...", file=sys.stderr)
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all tasks
         future_to_repo = {
-            executor.submit(audit_repo_wrapper, args_tuple): args_tuple[0]
-            for args_tuple in audit_args
+            executor.submit(audit_repo_wrapper, ctx, repo): repo
+            for repo in repos
         }
 
         # Process completed tasks as they finish
@@ -542,12 +875,24 @@ def main():
                     update_progress(repo_name_result, "Skipped")
                 else:
                     results.append(result)
-                    score = result.get("compliance_score", 0)
-                    update_progress(repo_name_result, f"✓ (score: {score:.1f})")
+                    if notion_writer is not None:
+                        notion_writer.submit(result)
+                    update_progress(
+                        repo_name_result, f"✓ (score: {_format_score(result.compliance_score)})"
+                    )
             except Exception as e:
                 errors.append(repo_name)
                 update_progress(repo_name, f"✗ Exception: {e}")
 
+    if notion_writer is not None:
+        print("Waiting for Notion sync to finish...", file=sys.stderr)
+        notion_writer.close()
+
+    if result_cache is not None:
+        result_cache.close()
+    if etag_store is not None:
+        etag_store.close()
+
     # Print summary
     print(f"\n{'='*60}", file=sys.stderr)
     print(f"Audit complete: {len(results)}/{total} repositories", file=sys.stderr)
@@ -557,24 +902,29 @@ def main():
         print(f"Timed out: {len(timed_out)} repositories", file=sys.stderr)
     if errors:
         print(f"Errors: {len(errors)} repositories failed", file=sys.stderr)
-    if results:
-        avg_score = sum(r["compliance_score"] for r in results) / len(results)
+    if notion_writer is not None and notion_writer.failed:
+        print(f"Notion sync failed: {len(notion_writer.failed)} repositories", file=sys.stderr)
+    scores = [r.compliance_score for r in results if r.compliance_score is not None]
+    if scores:
+        avg_score = sum(scores) / len(scores)
         print(f"Average compliance score: {avg_score:.1f}", file=sys.stderr)
     print(f"{'='*60}", file=sys.stderr)
 
     # Output results
     output = {
-        "audit_timestamp": datetime.now(timezone.utc).isoformat(),
+        "audit_timestamp": audit_ts.isoformat(),
         "repos_audited": len(results),
         "results": results,
     }
 
+    payload = _dump_output(output)
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(output, f, indent=2)
+        with open(args.output, "wb") as f:
+            f.write(payload)
         print(f"Results written to {args.output}", file=sys.stderr)
     else:
-        print(json.dumps(output, indent=2))
+        sys.stdout.buffer.write(payload + b"\n")
+        sys.stdout.flush()
 
     return 0
 
@@ -5,8 +5,16 @@ import argparse
 import sys
 from datetime import datetime, timedelta, timezone
 
+from ._clients import get_gh
+from .checks import PROTECTED_BRANCHES, parse_timestamp, select_stale_branches
 from .gh_api import GitHubAPI
 
+# Common non-standard branch prefixes and their SOP-compliant replacements
+_SUGGEST = {
+    "feat/": "feature/",
+    "fix/": "bugfix/",
+}
+
 
 def delete_stale_branches(
     gh_api: GitHubAPI,
@@ -28,33 +36,22 @@ def delete_stale_branches(
         List of deleted/excluded branch names
     """
     if exclude_branches is None:
-        exclude_branches = ["main", "master", "staging"]
+        exclude_branches = PROTECTED_BRANCHES
 
     branches = gh_api.list_branches(repo)
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-    stale = []
-    for branch in branches:
-        name = branch.get("name", "")
-        if name in exclude_branches:
-            continue
-
-        commit = branch.get("commit", {})
-        commit_data = commit.get("commit", {})
-        author_data = commit_data.get("author", {})
-        date_str = author_data.get("date")
-
-        if date_str:
-            try:
-                commit_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                if commit_date < cutoff:
-                    stale.append({
-                        "name": name,
-                        "last_commit": date_str,
-                        "days_old": (datetime.now(timezone.utc) - commit_date).days,
-                    })
-            except (ValueError, AttributeError):
-                pass
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
+    now_ts = now.timestamp()
+
+    # Only the (usually few) stale branches need a parsed date, for the age report
+    stale = [
+        {
+            "name": name,
+            "last_commit": date_str,
+            "days_old": int((now_ts - parse_timestamp(date_str)) // 86400),
+        }
+        for name, date_str in select_stale_branches(branches, cutoff, exclude_branches)
+    ]
 
     deleted = []
     for branch_info in stale:
@@ -83,8 +80,7 @@ def check_branch_naming(repo: str, branches: list, allow_release: bool = False)
     """
     from .checks import ComplianceChecker
 
-    gh_api = GitHubAPI()
-    checker = ComplianceChecker(gh_api)
+    checker = ComplianceChecker(get_gh())
 
     result = checker.check_branch_naming(branches, allow_release_branches=allow_release)
 
@@ -93,10 +89,10 @@ def check_branch_naming(repo: str, branches: list, allow_release: bool = False)
         for violation in result["violations"]:
             print(f"  - {violation}")
             # Suggest rename
-            if violation.startswith("feat/"):
-                print(f"    → Suggested: feature/{violation[5:]}")
-            elif violation.startswith("fix/"):
-                print(f"    → Suggested: bugfix/{violation[4:]}")
+            for prefix, replacement in _SUGGEST.items():
+                if violation.startswith(prefix):
+                    print(f"    → Suggested: {replacement}{violation[len(prefix):]}")
+                    break
 
     return result
 
@@ -113,7 +109,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        gh_api = GitHubAPI()
+        gh_api = get_gh()
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
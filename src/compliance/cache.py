@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Persistent on-disk cache of per-repository audit results."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "de-utils-compliance" / "audit-cache.sqlite3"
+DEFAULT_ETAG_PATH = Path.home() / ".cache" / "de-utils-compliance" / "etag-cache.sqlite3"
+DEFAULT_NOTION_DBS_PATH = Path.home() / ".cache" / "de-utils-compliance" / "notion-dbs.json"
+
+
+def config_fingerprint(config: Dict[str, Any], *extra: Any) -> str:
+    """Hash the audit configuration so cached results are invalidated when it changes.
+
+    Args:
+        config: Loaded configuration dict
+        *extra: Additional values that affect the result shape (e.g. property filters)
+
+    Returns:
+        Hex digest identifying this configuration
+    """
+    payload = json.dumps([config, *extra], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed cache of audit results keyed by repository and default-branch HEAD SHA.
+
+    A cached result is only returned when the repository's HEAD SHA and the configuration
+    fingerprint both match what was recorded, and the entry is younger than ``ttl_hours``.
+    """
+
+    def __init__(self, path: Optional[str] = None, config_hash: str = "", ttl_hours: float = 168):
+        """Open (or create) the result cache.
+
+        Args:
+            path: SQLite file path (defaults to ~/.cache/de-utils-compliance/audit-cache.sqlite3)
+            config_hash: Fingerprint of the configuration producing the results
+            ttl_hours: Maximum age of a cached result before it is re-audited
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.config_hash = config_hash
+        self.ttl_seconds = ttl_hours * 3600
+
+        # Shared by all audit workers; sqlite3 connections need external locking for that
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS audit_results ("
+                " repo TEXT PRIMARY KEY,"
+                " head_sha TEXT,"
+                " config_hash TEXT,"
+                " audited_at REAL,"
+                " result_json BLOB)"
+            )
+
+    def get(self, repo: str, head_sha: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a repository if it is still valid.
+
+        Args:
+            repo: Repository full name
+            head_sha: Current HEAD SHA of the default branch
+
+        Returns:
+            Cached result dict, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT head_sha, config_hash, audited_at, result_json"
+                " FROM audit_results WHERE repo = ?",
+                (repo,),
+            ).fetchone()
+
+        if not row:
+            return None
+
+        cached_sha, cached_config, audited_at, result_json = row
+        if cached_sha != head_sha or cached_config != self.config_hash:
+            return None
+        if time.time() - audited_at >= self.ttl_seconds:
+            return None
+        return json.loads(result_json)
+
+    def last_result(self, repo: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent cached result for a repository, however old.
+
+        Args:
+            repo: Repository full name
+
+        Returns:
+            Cached result dict, or None if the repository has never been cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_json FROM audit_results WHERE repo = ?",
+                (repo,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, repo: str, head_sha: str, result: Dict[str, Any]) -> None:
+        """Store an audit result.
+
+        Args:
+            repo: Repository full name
+            head_sha: HEAD SHA of the default branch the result was computed for
+            result: Audit result dict
+        """
+        result_json = json.dumps(result).encode("utf-8")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO audit_results"
+                " (repo, head_sha, config_hash, audited_at, result_json)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (repo, head_sha, self.config_hash, time.time(), result_json),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ETagStore:
+    """SQLite-backed store of HTTP ETags and response bodies keyed by request URL.
+
+    Lets the GitHub client send conditional requests (``If-None-Match``); a ``304 Not
+    Modified`` answer doesn't count against the rate limit and the stored body is reused.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Open (or create) the ETag store.
+
+        Args:
+            path: SQLite file path (defaults to ~/.cache/de-utils-compliance/etag-cache.sqlite3)
+        """
+        self.path = Path(path) if path else DEFAULT_ETAG_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS etags ("
+                " url TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " body BLOB)"
+            )
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """Return the stored ETag and response body for a URL.
+
+        Args:
+            url: Full request URL including query string
+
+        Returns:
+            (etag, body) tuple, or None if the URL has not been seen
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, body FROM etags WHERE url = ?", (url,)
+            ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def put(self, url: str, etag: str, body: bytes) -> None:
+        """Store the ETag and response body for a URL.
+
+        Args:
+            url: Full request URL including query string
+            etag: ETag header value exactly as returned by the server
+            body: Raw response body
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO etags (url, etag, body) VALUES (?, ?, ?)",
+                (url, etag, body),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
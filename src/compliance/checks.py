@@ -1,18 +1,147 @@
 #!/usr/bin/env python3
 """Compliance policy checks and scoring."""
 
+import calendar
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .gh_api import GitHubAPI
 
+# GitHub renders commit timestamps as fixed-width UTC strings, which sort chronologically
+GITHUB_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Top-level "name:" of a workflow file, as GitHub shows it (quotes stripped)
+_WORKFLOW_NAME_RE = re.compile(r"""^name:\s*["']?(.*?)["']?\s*$""", re.MULTILINE)
+
+# Classifies a workflow from "<path>\x00<name>" in one match call. Each bucket is an
+# independent lookahead anchored at the start, so a workflow can land in several buckets,
+# and the \x00 separator keeps path-only tests from matching the name and vice versa.
+_CI_CLASSIFY_RE = re.compile(
+    r"^(?=(?P<pr>[^\x00]*pull_request|[^\x00]*\x00.*pr))?"
+    r"(?=(?P<tag>[^\x00]*tag|[^\x00]*\x00.*release))?"
+    r"(?=(?P<deploy>[^\x00]*(?:deploy[^\x00]*branch|branch[^\x00]*deploy)))?",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Long-lived branches exempt from naming rules and never treated as stale
+PROTECTED_BRANCHES = frozenset({"main", "master", "staging"})
+
+# /stats/contributors only lists the top 100 authors
+_STATS_AUTHOR_LIMIT = 100
+
+# ISO 8601 timestamps with optional fractional seconds and a Z or +HH:MM offset
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(Z|[+-]\d{2}:\d{2})$"
+)
+
+
+def parse_timestamp(date_str: str) -> Optional[float]:
+    """Convert an ISO 8601 timestamp to epoch seconds without building a datetime.
+
+    Args:
+        date_str: Timestamp such as GitHub's "2024-05-01T12:00:00Z"
+
+    Returns:
+        Epoch seconds (fractional seconds dropped), or None if the string isn't ISO 8601
+    """
+    m = _ISO_RE.match(date_str)
+    if not m:
+        try:
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00")).timestamp()
+        except (ValueError, AttributeError):
+            return None
+
+    year, month, day, hour, minute, second, offset = m.groups()
+    ts = calendar.timegm(
+        (int(year), int(month), int(day), int(hour), int(minute), int(second), 0, 0, 0)
+    )
+    if offset != "Z":
+        sign = 1 if offset[0] == "+" else -1
+        ts -= sign * (int(offset[1:3]) * 3600 + int(offset[4:6]) * 60)
+    return ts
+
+
+def flatten_branches(branches: List[Dict[str, Any]]) -> Tuple[List[str], List[Optional[str]]]:
+    """Split GitHub branch dicts into parallel name and last-commit-date lists.
+
+    Walks each branch's nested JSON once so several checks can share the result.
+
+    Args:
+        branches: List of branch dicts from the GitHub API
+
+    Returns:
+        (names, dates) where dates[i] is the last commit date of names[i] or None
+    """
+    names = []
+    dates = []
+    for branch in branches:
+        names.append(branch.get("name", ""))
+        dates.append(branch.get("commit", {}).get("commit", {}).get("author", {}).get("date"))
+    return names, dates
+
+
+def select_stale_branches(
+    branches: Optional[List[Dict[str, Any]]],
+    cutoff: datetime,
+    exclude_branches: Iterable[str] = PROTECTED_BRANCHES,
+    names: Optional[List[str]] = None,
+    dates: Optional[List[Optional[str]]] = None,
+) -> List[Tuple[str, str]]:
+    """Select branches whose last commit is older than a cutoff.
+
+    Canonical GitHub timestamps are compared as strings against the cutoff rendered
+    in the same format, and other ISO 8601 forms as epoch seconds, so no per-branch
+    datetime is built.
+
+    Args:
+        branches: List of branch dicts from the GitHub API (ignored if names/dates are given)
+        cutoff: Timezone-aware datetime; branches last committed before it are stale
+        exclude_branches: Branch names that are never considered stale
+        names: Pre-flattened branch names from flatten_branches
+        dates: Pre-flattened last commit dates from flatten_branches
+
+    Returns:
+        List of (branch_name, last_commit_date_str) tuples in input order
+    """
+    cutoff_str = cutoff.astimezone(timezone.utc).strftime(GITHUB_TIMESTAMP_FORMAT)
+    cutoff_ts = cutoff.timestamp()
+    # Hash once so the per-branch membership test is O(1) (free for the default frozenset)
+    exclude = frozenset(exclude_branches)
+    if names is None or dates is None:
+        names, dates = flatten_branches(branches)
+    stale = []
+
+    for name, date_str in zip(names, dates):
+        if not date_str or name in exclude:
+            continue
+
+        if len(date_str) == 20 and date_str[-1] == "Z":
+            is_stale = date_str < cutoff_str
+        else:
+            ts = parse_timestamp(date_str)
+            if ts is None:
+                continue
+            is_stale = ts < cutoff_ts
+
+        if is_stale:
+            stale.append((name, date_str))
+
+    return stale
+
 
 class ComplianceChecker:
     """Check repository compliance against SOP policies."""
 
     # Standard files that should exist
     STANDARD_FILES = ["LICENSE", "SECURITY.md", "CONTRIBUTING.md", "CODEOWNERS"]
+    _STANDARD_FILES_SET = frozenset(STANDARD_FILES)
+    _STANDARD_FILES_COUNT = len(STANDARD_FILES)
+
+    # Directories GitHub also reads CODEOWNERS from
+    CODEOWNERS_DIRS = (".github", "docs")
 
     # Allowed branch name patterns
     ALLOWED_BRANCH_PATTERNS = [
@@ -28,6 +157,23 @@ class ComplianceChecker:
         r"^v\d+\.\d+.*",
     ]
 
+    # Both pattern lists are fused into one regex, so a branch name costs a single match.
+    # The disallowed group comes first, so it wins whenever both could match; the IaC
+    # variant drops release/ from the disallowed set.
+    _BRANCH_CLASSIFY_RE = re.compile(
+        "(?P<disallowed>" + "|".join(f"(?:{p})" for p in DISALLOWED_BRANCH_PATTERNS) + ")"
+        "|(?P<allowed>" + "|".join(f"(?:{p})" for p in ALLOWED_BRANCH_PATTERNS) + ")"
+    )
+    _BRANCH_CLASSIFY_RE_IAC = re.compile(
+        "(?P<disallowed>"
+        + "|".join(f"(?:{p})" for p in DISALLOWED_BRANCH_PATTERNS if not p.startswith("^release/"))
+        + ")"
+        "|(?P<allowed>" + "|".join(f"(?:{p})" for p in ALLOWED_BRANCH_PATTERNS) + ")"
+    )
+
+    # Long-lived branches exempt from naming rules
+    _SKIP_BRANCHES = PROTECTED_BRANCHES
+
     # Bot patterns to exclude from contributor counts
     BOT_PATTERNS = [
         r".*\[bot\]$",
@@ -36,6 +182,17 @@ class ComplianceChecker:
         r"^renovate",
     ]
 
+    # Score weight of each check, out of _TOTAL_WEIGHT
+    _WEIGHTS = {
+        "default_branch": 10,
+        "branch_protection": 20,
+        "branch_naming": 10,
+        "standard_files": 15,
+        "ci_patterns": 15,
+        "stale_branches": 10,
+    }
+    _TOTAL_WEIGHT = sum(_WEIGHTS.values())
+
     def __init__(self, gh_api: GitHubAPI, config: Optional[Dict[str, Any]] = None):
         """Initialize compliance checker.
 
@@ -46,8 +203,191 @@ class ComplianceChecker:
         self.gh_api = gh_api
         self.config = config or {}
         self.exceptions = self.config.get("exceptions") or {}
+        # Resolved once; check_default_branch runs for every repo
+        self._default_branch_exceptions: Dict[str, str] = (
+            self.exceptions.get("default_branch") or {}
+        )
         self.contributor_window_days = self.config.get("contributor_window_days", 365)
         self.primary_contributor_window_days = self.config.get("primary_contributor_window_days", 90)
+        # Commits of the widest window fetched so far per repo, and per-window tallies
+        self._commit_cache: Dict[str, Tuple[int, List[Tuple[Optional[str], str]]]] = {}
+        self._contrib_cache: Dict[Tuple[str, int], Counter] = {}
+        self._stats_cache: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        self._now: Optional[datetime] = None
+        self._protection_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _utcnow(self) -> datetime:
+        """Current UTC time, read once and reused until the repo's score is computed."""
+        if self._now is None:
+            self._now = datetime.now(timezone.utc)
+        return self._now
+
+    def run_all_checks(
+        self,
+        repo: str,
+        repo_data: Dict[str, Any],
+        branches: Optional[List[Dict[str, Any]]] = None,
+        allow_release_branches: bool = False,
+    ) -> Dict[str, Any]:
+        """Run every compliance check for a repository, overlapping the GitHub requests.
+
+        Branch protection, standard files, CI workflows and (if not given) the branch list
+        are fetched concurrently; the branch checks then run locally on the branch list.
+
+        Args:
+            repo: Repository name
+            repo_data: Repository JSON from GitHubAPI.get_repo
+            branches: Already-fetched branch list (None = fetch it)
+            allow_release_branches: Whether release branches are allowed (e.g., for IaC repos)
+
+        Returns:
+            Dict of check results, as consumed by compute_compliance_score
+        """
+        default_branch = repo_data.get("default_branch", "main")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            protection_future = executor.submit(self.check_branch_protection, repo, default_branch)
+            files_future = executor.submit(self.check_standard_files, repo, default_branch)
+            ci_future = executor.submit(self.check_ci_patterns, repo)
+            if branches is None:
+                branches = executor.submit(self.gh_api.list_branches, repo).result()
+
+            # Walk the branch JSON once for both branch checks
+            names, dates = flatten_branches(branches)
+            default_branch_compliant, default_branch_msg = self.check_default_branch(repo_data)
+            branch_naming = self.check_branch_naming(
+                None, allow_release_branches=allow_release_branches, names=names
+            )
+            stale_branches = self.check_stale_branches(None, names=names, dates=dates)
+
+            return {
+                "default_branch_compliant": default_branch_compliant,
+                "default_branch_message": default_branch_msg,
+                "branch_protection": protection_future.result(),
+                "branch_naming": branch_naming,
+                "standard_files": files_future.result(),
+                "ci_patterns": ci_future.result(),
+                "stale_branches": stale_branches,
+            }
+
+    def refresh_checks(
+        self,
+        repo: str,
+        repo_data: Dict[str, Any],
+        cached_checks: Dict[str, Any],
+        allow_release_branches: bool = False,
+    ) -> Dict[str, Any]:
+        """Re-run the checks a cached result can't vouch for, keeping the rest.
+
+        Standard files and CI workflows are read from the default branch HEAD, so they
+        are still valid while the HEAD SHA is unchanged. Branch protection is a repository
+        setting and the branch checks depend on other branches and the clock, so those are
+        fetched again (both requests are ETag-conditional, so an unchanged answer is free).
+
+        Args:
+            repo: Repository name
+            repo_data: Repository JSON from GitHubAPI.get_repo
+            cached_checks: Checks of the cached result
+            allow_release_branches: Whether release branches are allowed (e.g., for IaC repos)
+
+        Returns:
+            Dict of check results, as consumed by compute_compliance_score
+        """
+        default_branch = repo_data.get("default_branch", "main")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            protection_future = executor.submit(self.check_branch_protection, repo, default_branch)
+            names, dates = flatten_branches(self.gh_api.list_branches(repo))
+            default_branch_compliant, default_branch_msg = self.check_default_branch(repo_data)
+
+            return {
+                **cached_checks,
+                "default_branch_compliant": default_branch_compliant,
+                "default_branch_message": default_branch_msg,
+                "branch_protection": protection_future.result(),
+                "branch_naming": self.check_branch_naming(
+                    None, allow_release_branches=allow_release_branches, names=names
+                ),
+                "stale_branches": self.check_stale_branches(None, names=names, dates=dates),
+            }
+
+    def check_all_via_graphql(
+        self,
+        repo: str,
+        repo_data: Dict[str, Any],
+        allow_release_branches: bool = False,
+    ) -> Dict[str, Any]:
+        """Run every compliance check from a single GraphQL bundle.
+
+        Produces the same dict as ``run_all_checks``; callers can fall back to that REST
+        path if the GraphQL request fails.
+
+        Args:
+            repo: Repository name
+            repo_data: Repository JSON from GitHubAPI.get_repo
+            allow_release_branches: Whether release branches are allowed (e.g., for IaC repos)
+
+        Returns:
+            Dict of check results, as consumed by compute_compliance_score
+        """
+        bundle = self.gh_api.fetch_compliance_bundle(repo)
+
+        # Branch protection, in the shape evaluate_branch_protection produces from REST
+        rule = (bundle.get("defaultBranchRef") or {}).get("branchProtectionRule")
+        if rule:
+            branch_protection = {
+                "protected": True,
+                "requires_pr": bool(rule.get("requiresApprovingReviews")),
+                "required_reviewers": rule.get("requiredApprovingReviewCount") or 0,
+                "required_checks": rule.get("requiredStatusCheckContexts") or [],
+                "linear_history": bool(rule.get("requiresLinearHistory")),
+                "signed_commits": bool(rule.get("requiresCommitSignatures")),
+                "restrict_deletions": bool(rule.get("restrictsPushes")),
+                "restrict_force_push": not rule.get("allowsForcePushes"),
+            }
+        else:
+            branch_protection = self.evaluate_branch_protection(None)
+
+        def non_empty(alias: str) -> bool:
+            blob = bundle.get(alias)
+            return bool(blob) and (blob.get("byteSize") or 0) > 0
+
+        present = {
+            filename
+            for filename, aliases in (
+                ("LICENSE", ("license",)),
+                ("SECURITY.md", ("security",)),
+                ("CONTRIBUTING.md", ("contributing",)),
+                ("CODEOWNERS", ("codeowners", "codeownersGithub", "codeownersDocs")),
+            )
+            if any(non_empty(alias) for alias in aliases)
+        }
+
+        # Workflow names come from each file's top-level "name:", defaulting to its path
+        workflows = []
+        for entry in (bundle.get("workflows") or {}).get("entries") or []:
+            if not entry["name"].endswith((".yml", ".yaml")):
+                continue
+            text = (entry.get("object") or {}).get("text") or ""
+            m = _WORKFLOW_NAME_RE.search(text)
+            workflows.append({"path": entry["path"], "name": m.group(1) if m else entry["path"]})
+
+        nodes = (bundle.get("refs") or {}).get("nodes") or []
+        names = [node["name"] for node in nodes]
+        dates = [((node.get("target") or {}).get("author") or {}).get("date") for node in nodes]
+
+        default_branch_compliant, default_branch_msg = self.check_default_branch(repo_data)
+        return {
+            "default_branch_compliant": default_branch_compliant,
+            "default_branch_message": default_branch_msg,
+            "branch_protection": branch_protection,
+            "branch_naming": self.check_branch_naming(
+                None, allow_release_branches=allow_release_branches, names=names
+            ),
+            "standard_files": self.evaluate_standard_files(present),
+            "ci_patterns": self.classify_workflows(workflows),
+            "stale_branches": self.check_stale_branches(None, names=names, dates=dates),
+        }
 
     def check_default_branch(self, repo_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Check if default branch is 'main' (with exceptions).
@@ -59,9 +399,8 @@ class ComplianceChecker:
         repo_name = repo_data.get("full_name", repo_data.get("name", ""))
 
         # Check exceptions
-        default_branch_exceptions = self.exceptions.get("default_branch") or {}
-        if repo_name in default_branch_exceptions:
-            expected = self.exceptions["default_branch"][repo_name]
+        expected = self._default_branch_exceptions.get(repo_name)
+        if expected is not None:
             if default_branch == expected:
                 return True, f"Exception: default branch is '{expected}'"
             return False, f"Exception expects '{expected}' but found '{default_branch}'"
@@ -76,8 +415,23 @@ class ComplianceChecker:
         Returns:
             Dict with protection checks
         """
-        protection = self.gh_api.get_branch_protection(repo, branch)
+        key = (repo, branch)
+        if key not in self._protection_cache:
+            self._protection_cache[key] = self.evaluate_branch_protection(
+                self.gh_api.get_branch_protection(repo, branch)
+            )
+        return self._protection_cache[key]
+
+    @staticmethod
+    def evaluate_branch_protection(protection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Evaluate an already-fetched branch protection payload.
 
+        Args:
+            protection: Branch protection JSON, or None if the branch is unprotected
+
+        Returns:
+            Dict with protection checks
+        """
         if not protection:
             return {
                 "protected": False,
@@ -93,12 +447,12 @@ class ComplianceChecker:
         required_status_checks = protection.get("required_status_checks", {})
         enforce_admins = protection.get("enforce_admins", {})
         restrictions = protection.get("restrictions")
-        required_pull_request_reviews = protection.get("required_pull_request_reviews", {})
+        rpr = protection.get("required_pull_request_reviews")
 
         return {
             "protected": True,
-            "requires_pr": protection.get("required_pull_request_reviews") is not None,
-            "required_reviewers": required_pull_request_reviews.get("required_approving_review_count", 0),
+            "requires_pr": rpr is not None,
+            "required_reviewers": (rpr or {}).get("required_approving_review_count", 0),
             "required_checks": required_status_checks.get("contexts", []),
             "linear_history": protection.get("required_linear_history", {}).get("enabled", False),
             "signed_commits": protection.get("required_signatures", False),
@@ -106,43 +460,43 @@ class ComplianceChecker:
             "restrict_force_push": protection.get("allow_force_pushes", {}).get("enabled", False) is False,
         }
 
-    def check_branch_naming(self, branches: List[Dict[str, Any]], allow_release_branches: bool = False) -> Dict[str, Any]:
+    def check_branch_naming(
+        self,
+        branches: Optional[List[Dict[str, Any]]],
+        allow_release_branches: bool = False,
+        names: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """Check branch naming compliance.
 
         Args:
-            branches: List of branch dicts with 'name' key
+            branches: List of branch dicts with 'name' key (ignored if names is given)
             allow_release_branches: Whether release branches are allowed (e.g., for IaC repos)
+            names: Pre-flattened branch names from flatten_branches
 
         Returns:
             Dict with compliance info
         """
         violations = []
-        allowed_patterns = self.ALLOWED_BRANCH_PATTERNS.copy()
-        disallowed_patterns = self.DISALLOWED_BRANCH_PATTERNS.copy()
-
-        if allow_release_branches:
-            disallowed_patterns = [p for p in disallowed_patterns if not p.startswith("^release/")]
-
-        for branch in branches:
-            name = branch.get("name", "")
-            if name in ["main", "master", "staging"]:
+        classify = (
+            self._BRANCH_CLASSIFY_RE_IAC if allow_release_branches else self._BRANCH_CLASSIFY_RE
+        ).match
+        skip = self._SKIP_BRANCHES
+        if names is None:
+            names = [branch.get("name", "") for branch in branches]
+
+        for name in names:
+            if name in skip:
                 continue
 
-            # Check if matches allowed pattern
-            matches_allowed = any(re.match(pattern, name) for pattern in allowed_patterns)
-
-            # Check if matches disallowed pattern
-            matches_disallowed = any(re.match(pattern, name) for pattern in disallowed_patterns)
-
-            if matches_disallowed:
-                violations.append(name)
-            elif not matches_allowed:
+            # Disallowed patterns win; anything else must match an allowed pattern
+            m = classify(name)
+            if m is None or m.lastgroup == "disallowed":
                 violations.append(name)
 
         return {
             "compliant": len(violations) == 0,
             "violations": violations,
-            "total_branches": len(branches),
+            "total_branches": len(names),
         }
 
     def check_standard_files(self, repo: str, default_branch: str) -> Dict[str, Any]:
@@ -151,15 +505,34 @@ class ComplianceChecker:
         Returns:
             Dict with file check results
         """
-        found = []
-        missing = []
+        # One tree listing instead of a contents request per file; empty files don't count
+        root = self.gh_api.get_tree(repo, default_branch)
+        root_files = {e["path"] for e in root if e.get("type") == "blob" and e.get("size", 1) > 0}
+        present = set(self._STANDARD_FILES_SET.intersection(root_files))
+
+        if "CODEOWNERS" not in present:
+            subtrees = {e["path"]: e["sha"] for e in root if e.get("type") == "tree"}
+            for directory in self.CODEOWNERS_DIRS:
+                if directory in subtrees and any(
+                    e["path"] == "CODEOWNERS" and e.get("type") == "blob" and e.get("size", 1) > 0
+                    for e in self.gh_api.get_tree(repo, subtrees[directory])
+                ):
+                    present.add("CODEOWNERS")
+                    break
+
+        return self.evaluate_standard_files(present)
+
+    def evaluate_standard_files(self, present: Set[str]) -> Dict[str, Any]:
+        """Evaluate standard file presence from an already-fetched set of file names.
 
-        for filename in self.STANDARD_FILES:
-            content = self.gh_api.get_file_contents(repo, filename, ref=default_branch)
-            if content:
-                found.append(filename)
-            else:
-                missing.append(filename)
+        Args:
+            present: Names of standard files that exist (and are non-empty) in the repo
+
+        Returns:
+            Dict with file check results
+        """
+        found = [f for f in self.STANDARD_FILES if f in present]
+        missing = [f for f in self.STANDARD_FILES if f not in present]
 
         return {
             "found": found,
@@ -173,22 +546,32 @@ class ComplianceChecker:
         Returns:
             Dict with CI pattern checks
         """
-        workflows = self.gh_api.list_workflows(repo)
+        return self.classify_workflows(self.gh_api.list_workflows(repo))
+
+    @staticmethod
+    def classify_workflows(workflows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Classify an already-fetched list of workflows into CI patterns.
+
+        Args:
+            workflows: Workflow dicts with 'path' and 'name' keys
 
+        Returns:
+            Dict with CI pattern checks
+        """
         pr_workflows = []
         tag_workflows = []
         branch_deploy_workflows = []
 
         for workflow in workflows:
-            path = workflow.get("path", "")
             name = workflow.get("name", "")
 
             # Check workflow file contents (simplified - would need to parse YAML for full check)
-            if "pull_request" in path.lower() or "pr" in name.lower():
+            m = _CI_CLASSIFY_RE.match(f"{workflow.get('path', '')}\x00{name}")
+            if m["pr"] is not None:
                 pr_workflows.append(name)
-            if "tag" in path.lower() or "release" in name.lower():
+            if m["tag"] is not None:
                 tag_workflows.append(name)
-            if "deploy" in path.lower() and "branch" in path.lower():
+            if m["deploy"] is not None:
                 branch_deploy_workflows.append(name)
 
         return {
@@ -200,36 +583,29 @@ class ComplianceChecker:
             "branch_deploy_workflows": branch_deploy_workflows,
         }
 
-    def check_stale_branches(self, branches: List[Dict[str, Any]], days: int = 90) -> Dict[str, Any]:
+    def check_stale_branches(
+        self,
+        branches: Optional[List[Dict[str, Any]]],
+        days: int = 90,
+        names: Optional[List[str]] = None,
+        dates: Optional[List[Optional[str]]] = None,
+    ) -> Dict[str, Any]:
         """Check for stale branches.
 
         Args:
-            branches: List of branch dicts
+            branches: List of branch dicts (ignored if names/dates are given)
             days: Days threshold for staleness
+            names: Pre-flattened branch names from flatten_branches
+            dates: Pre-flattened last commit dates from flatten_branches
 
         Returns:
             Dict with stale branch info
         """
-        stale = []
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-        for branch in branches:
-            name = branch.get("name", "")
-            if name in ["main", "master", "staging"]:
-                continue
-
-            commit = branch.get("commit", {})
-            commit_date_str = commit.get("commit", {}).get("author", {}).get("date")
-            if commit_date_str:
-                try:
-                    commit_date = datetime.fromisoformat(commit_date_str.replace("Z", "+00:00"))
-                    if commit_date < cutoff:
-                        stale.append({
-                            "name": name,
-                            "last_commit": commit_date_str,
-                        })
-                except (ValueError, AttributeError):
-                    pass
+        cutoff = self._utcnow() - timedelta(days=days)
+        stale = [
+            {"name": name, "last_commit": date_str}
+            for name, date_str in select_stale_branches(branches, cutoff, names=names, dates=dates)
+        ]
 
         return {
             "stale_count": len(stale),
@@ -248,7 +624,95 @@ class ComplianceChecker:
         """
         if not languages:
             return None
-        return max(languages.items(), key=lambda x: x[1])[0]
+        return max(languages, key=languages.get)
+
+    def _commits_in_window(self, repo: str, window_days: int) -> List[Tuple[Optional[str], str]]:
+        """Get (author login, committer date) for commits in the last ``window_days`` days.
+
+        Commits are streamed from the API and only these two fields are kept, so the full
+        commit payloads are never held at once. They come back newest first and capped at
+        1000, so filtering a wider window's pairs by date yields exactly what a separate,
+        narrower request would have returned.
+        """
+        cached = self._commit_cache.get(repo)
+        if cached and cached[0] >= window_days:
+            cached_days, commits = cached
+            if cached_days == window_days:
+                return commits
+            cutoff_str = (self._utcnow() - timedelta(days=window_days)).strftime(
+                GITHUB_TIMESTAMP_FORMAT
+            )
+            return [c for c in commits if (c[1] or cutoff_str) >= cutoff_str]
+
+        since = (self._utcnow() - timedelta(days=window_days)).isoformat()
+        # Limit to 1000 commits max to avoid timeout on large repos
+        commits = [
+            (
+                (commit.get("author") or {}).get("login"),
+                commit.get("commit", {}).get("committer", {}).get("date"),
+            )
+            for commit in self.gh_api.get_repo_commits(repo, since=since, max_commits=1000)
+        ]
+        self._commit_cache[repo] = (window_days, commits)
+        return commits
+
+    def _aggregate_contributors(self, repo: str, window_days: int) -> Counter:
+        """Count commits per human contributor over a window, once per (repo, window).
+
+        Args:
+            repo: Repository name
+            window_days: Days to look back
+
+        Returns:
+            Counter mapping login to commit count (bots excluded)
+        """
+        key = (repo, window_days)
+        if key not in self._contrib_cache:
+            counts = self._contributors_from_stats(repo, window_days)
+            if counts is None:
+                # Tally every login in one Counter pass, then test each distinct login for
+                # bot-ness once instead of once per commit
+                counts = Counter(login for login, _ in self._commits_in_window(repo, window_days))
+                for login in [login for login in counts if not login or self._is_bot(login)]:
+                    del counts[login]
+            self._contrib_cache[key] = counts
+        return self._contrib_cache[key]
+
+    def _contributors_from_stats(self, repo: str, window_days: int) -> Optional[Counter]:
+        """Count commits per human contributor from the contributor statistics API.
+
+        One request covers the whole year, instead of paging through up to 1000 commits.
+        Statistics are bucketed by week, so a week that overlaps the start of the window
+        is counted in full. The API lists only the top 100 authors, so a repository with
+        that many is left to the commits path, which sees every contributor.
+
+        Args:
+            repo: Repository name
+            window_days: Days to look back
+
+        Returns:
+            Counter mapping login to commit count (bots excluded), or None if GitHub has
+            not finished computing the statistics or the author list may be truncated
+        """
+        if repo not in self._stats_cache:
+            self._stats_cache[repo] = self.gh_api.get_contributor_stats(repo)
+        stats = self._stats_cache[repo]
+        if stats is None or len(stats) >= _STATS_AUTHOR_LIMIT:
+            return None
+
+        # A week starting at "w" covers [w, w + 7 days)
+        cutoff = self._utcnow().timestamp() - window_days * 86400 - 7 * 86400
+        counts = Counter()
+        for entry in stats:
+            login = (entry.get("author") or {}).get("login")
+            if not login or self._is_bot(login):
+                continue
+            total = sum(
+                week.get("c", 0) for week in entry.get("weeks", ()) if week.get("w", 0) > cutoff
+            )
+            if total:
+                counts[login] = total
+        return counts
 
     def get_primary_contributor(self, repo: str, window_days: Optional[int] = None) -> Optional[Tuple[str, int]]:
         """Get primary contributor by commit count.
@@ -261,23 +725,9 @@ class ComplianceChecker:
             Tuple of (username, commit_count) or None
         """
         window_days = window_days or self.primary_contributor_window_days
-        since = (datetime.now(timezone.utc) - timedelta(days=window_days)).isoformat()
 
         try:
-            # Limit to 1000 commits max to avoid timeout on large repos
-            commits = self.gh_api.get_repo_commits(repo, since=since, max_commits=1000)
-            contributor_counts = {}
-
-            for commit in commits:
-                author = commit.get("author")
-                if not author:
-                    continue
-
-                login = author.get("login")
-                if not login or self._is_bot(login):
-                    continue
-
-                contributor_counts[login] = contributor_counts.get(login, 0) + 1
+            contributor_counts = self._aggregate_contributors(repo, window_days)
 
             if not contributor_counts:
                 # Fallback to longer window
@@ -285,8 +735,7 @@ class ComplianceChecker:
                     return self.get_primary_contributor(repo, self.contributor_window_days)
                 return None
 
-            primary = max(contributor_counts.items(), key=lambda x: x[1])
-            return primary
+            return contributor_counts.most_common(1)[0]
         except Exception:
             return None
 
@@ -301,23 +750,9 @@ class ComplianceChecker:
             Number of unique contributors
         """
         window_days = window_days or self.contributor_window_days
-        since = (datetime.now(timezone.utc) - timedelta(days=window_days)).isoformat()
 
         try:
-            # Limit to 1000 commits max to avoid timeout on large repos
-            commits = self.gh_api.get_repo_commits(repo, since=since, max_commits=1000)
-            contributors = set()
-
-            for commit in commits:
-                author = commit.get("author")
-                if not author:
-                    continue
-
-                login = author.get("login")
-                if login and not self._is_bot(login):
-                    contributors.add(login)
-
-            return len(contributors)
+            return len(self._aggregate_contributors(repo, window_days))
         except Exception:
             return 0
 
@@ -330,22 +765,18 @@ class ComplianceChecker:
         Returns:
             Humanized string like "2y 3m 5d" or "3m 5d" or "5d"
         """
-        now = datetime.now(timezone.utc)
-        delta = now - dt
+        # Whole days straight from epoch seconds; no timedelta needed
+        delta_days = int((self._utcnow().timestamp() - dt.timestamp()) // 86400)
 
-        years = delta.days // 365
-        months = (delta.days % 365) // 30
-        days = delta.days % 30
+        years, day_of_year = divmod(delta_days, 365)
+        # Day part is days % 30 (not day_of_year % 30) to keep existing scorecard values stable
+        parts = [
+            f"{value}{unit}"
+            for value, unit in ((years, "y"), (day_of_year // 30, "m"), (delta_days % 30, "d"))
+            if value > 0
+        ]
 
-        parts = []
-        if years > 0:
-            parts.append(f"{years}y")
-        if months > 0:
-            parts.append(f"{months}m")
-        if days > 0:
-            parts.append(f"{days}d")
-
-        return " ".join(parts) if parts else "0d"
+        return " ".join(parts) or "0d"
 
     def compute_compliance_score(self, checks: Dict[str, Any]) -> float:
         """Compute overall compliance score (0-100).
@@ -356,16 +787,10 @@ class ComplianceChecker:
         Returns:
             Score from 0 to 100
         """
-        weights = {
-            "default_branch": 10,
-            "branch_protection": 20,
-            "branch_naming": 10,
-            "standard_files": 15,
-            "ci_patterns": 15,
-            "stale_branches": 10,
-        }
+        # Scoring ends a repo's audit; a reused checker reads the clock afresh for the next one
+        self._now = None
 
-        total_weight = sum(weights.values())
+        weights = self._WEIGHTS
         score = 0
 
         # Default branch check
@@ -386,9 +811,8 @@ class ComplianceChecker:
         # Standard files
         files_check = checks.get("standard_files", {})
         found_count = len(files_check.get("found", []))
-        total_files = len(self.STANDARD_FILES)
-        if total_files > 0:
-            score += weights["standard_files"] * (found_count / total_files)
+        if self._STANDARD_FILES_COUNT > 0:
+            score += weights["standard_files"] * (found_count / self._STANDARD_FILES_COUNT)
 
         # CI patterns (simplified)
         ci_check = checks.get("ci_patterns", {})
@@ -397,14 +821,16 @@ class ComplianceChecker:
 
         # Stale branches (penalty)
         stale_count = checks.get("stale_branches", {}).get("stale_count", 0)
-        if stale_count == 0:
-            score += weights["stale_branches"]
-        elif stale_count < 5:
-            score += weights["stale_branches"] * 0.5
+        score += weights["stale_branches"] * (
+            1.0 if stale_count == 0 else 0.5 if stale_count < 5 else 0.0
+        )
 
-        return round((score / total_weight) * 100, 1)
+        return round((score / self._TOTAL_WEIGHT) * 100, 1)
 
     def _is_bot(self, username: str) -> bool:
-        """Check if username matches bot patterns."""
-        return any(re.match(pattern, username, re.IGNORECASE) for pattern in self.BOT_PATTERNS)
+        """Check if username matches bot patterns.
 
+        Matches the same names as BOT_PATTERNS (case-insensitively), using plain string tests.
+        """
+        name = username.lower()
+        return name.endswith(("bot", "[bot]")) or name.startswith(("dependabot", "renovate"))
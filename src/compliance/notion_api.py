@@ -1,22 +1,84 @@
 #!/usr/bin/env python3
 """Notion API client for compliance scorecard and tracking."""
 
-import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import urllib3
 
+from . import _json
+from ._http import USER_AGENT, shared_pool
+
+
+class RateLimiter:
+    """Token bucket for Notion requests, shared across threads.
+
+    Also holds the shared backoff deadline, so a 429 seen by one thread pauses all of them.
+    """
+
+    def __init__(self, rate_per_second: float = 3.0, burst: int = 3):
+        """Initialize rate limiter.
+
+        Args:
+            rate_per_second: Sustained request rate (Notion allows ~3 requests/second)
+            burst: Maximum number of requests that may be sent back to back
+        """
+        self.rate = rate_per_second
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._backoff_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._backoff_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._backoff_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def back_off(self, seconds: float) -> None:
+        """Pause all requests for at least ``seconds``."""
+        with self._lock:
+            self._backoff_until = max(self._backoff_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+# Notion's limit is per integration, so every client in the process meters against one bucket
+_SHARED_LIMITER = RateLimiter()
+
 
 class NotionAPI:
     """Notion API client for database operations."""
 
-    def __init__(self, token: Optional[str] = None):
+    # Seconds a page found by title is reused before it is looked up again
+    PAGE_CACHE_TTL = 300
+    # Times a request is resent after Notion answers 429 (on top of the pool's retries
+    # of transient 502/503/504 responses)
+    RATE_LIMIT_RETRIES = 3
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        pool_maxsize: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """Initialize Notion API client.
 
         Args:
             token: Notion integration token (defaults to NOTION_TOKEN env var)
+            pool_maxsize: Keep-alive connections per host (grows the shared pool if larger)
+            rate_limiter: Request rate limiter (defaults to one shared by the whole process)
         """
         self.token = token or os.getenv("NOTION_TOKEN")
         if not self.token:
@@ -26,27 +88,44 @@ class NotionAPI:
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "User-Agent": USER_AGENT,
+            "Connection": "keep-alive",
         }
-        self.http = urllib3.PoolManager()
+        # Process-wide pool, shared with the GitHub client and any other NotionAPI
+        self.http = shared_pool(pool_maxsize)
+        self.rate_limiter = rate_limiter or _SHARED_LIMITER
+        # (database_id, title) -> (page, expiry on the monotonic clock), and page_id -> key
+        self._page_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+        self._page_keys: Dict[str, Tuple[str, str]] = {}
+        self._page_cache_lock = threading.Lock()
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make API request with error handling."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        # Handle JSON body
+        # Handle JSON body (or one the caller already serialized)
         json_data = kwargs.pop("json", None)
-        body = None
+        body = kwargs.pop("body", None)
         if json_data:
-            body = json.dumps(json_data).encode("utf-8")
-
-        response = self.http.request(
-            method,
-            url,
-            headers=self.headers,
-            body=body,
-            **kwargs
-        )
+            body = _json.dumps(json_data)
+
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire()
+            response = self.http.request(
+                method,
+                url,
+                headers=self.headers,
+                body=body,
+                **kwargs
+            )
+            if response.status != 429:
+                break
+            # Pause every thread for as long as Notion asks. The request was rejected
+            # without being processed, so even a POST is safe to resend afterwards
+            self.rate_limiter.back_off(float(response.headers.get("Retry-After") or 1))
+            if attempt == self.RATE_LIMIT_RETRIES:
+                break
 
         # Check status code
         if response.status >= 400:
@@ -55,9 +134,11 @@ class NotionAPI:
                 f"HTTP {response.status}: {error_msg}"
             )
 
-        return json.loads(response.data.decode("utf-8"))
+        return _json.loads(response.data)
 
-    def create_database(self, parent_page_id: str, title: str, properties: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def create_database(
+        self, parent_page_id: str, title: str, properties: Mapping[str, Any]
+    ) -> Dict[str, Any]:
         """Create a Notion database.
 
         Args:
@@ -72,6 +153,76 @@ class NotionAPI:
         }
         return self._request("POST", "/databases", json=data)
 
+    def get_database(self, database_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a database.
+
+        Args:
+            database_id: Database ID
+
+        Returns:
+            Database object, or None if it doesn't exist (or isn't shared with the
+            integration) or has been deleted
+        """
+        try:
+            db = self._request("GET", f"/databases/{database_id}")
+        except urllib3.exceptions.HTTPError as e:
+            if "HTTP 404" not in str(e):
+                raise
+            return None
+        if db.get("archived") or db.get("in_trash"):
+            return None
+        return db
+
+    def find_database(self, parent_page_id: str, title: str) -> Optional[Dict[str, Any]]:
+        """Find a database with exactly this title directly under a page.
+
+        Args:
+            parent_page_id: Parent page ID (with or without dashes)
+            title: Database title
+
+        Returns:
+            First matching database that hasn't been deleted, or None
+        """
+        data = {
+            "query": title,
+            "filter": {"property": "object", "value": "database"},
+            "page_size": 100,
+        }
+        parent = parent_page_id.replace("-", "").lower()
+        for db in self._request("POST", "/search", json=data).get("results", []):
+            if db.get("archived") or db.get("in_trash"):
+                continue
+            if (db.get("parent") or {}).get("page_id", "").replace("-", "").lower() != parent:
+                continue
+            if "".join(t.get("plain_text", "") for t in db.get("title", [])) == title:
+                return db
+        return None
+
+    def create_database_raw(self, body: bytes) -> Dict[str, Any]:
+        """Create a Notion database from an already serialized request body.
+
+        Args:
+            body: JSON body of ``POST /databases`` (parent, title and properties)
+        """
+        return self._request("POST", "/databases", body=body)
+
+    def create_databases_raw(self, bodies: List[bytes]) -> List[Dict[str, Any]]:
+        """Create several databases at once from already serialized request bodies.
+
+        Notion has no bulk create endpoint, so the POSTs are sent concurrently over the
+        shared keep-alive pool (metered by the rate limiter) rather than one after another.
+
+        Args:
+            bodies: JSON body of ``POST /databases`` for each database
+
+        Returns:
+            Created database objects, in the order of ``bodies``
+        """
+        if not bodies:
+            return []
+        with ThreadPoolExecutor(max_workers=len(bodies)) as executor:
+            return list(executor.map(self.create_database_raw, bodies))
+
     def query_database(self, database_id: str, filter_obj: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Query a Notion database.
 
@@ -108,7 +259,11 @@ class NotionAPI:
             "parent": {"database_id": database_id},
             "properties": properties
         }
-        return self._request("POST", "/pages", json=data)
+        page = self._request("POST", "/pages", json=data)
+        title = self.page_title(page)
+        if title:
+            self._cache_page(database_id, title, page)
+        return page
 
     def update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Update a page in a database.
@@ -118,7 +273,12 @@ class NotionAPI:
             properties: Updated properties
         """
         data = {"properties": properties}
-        return self._request("PATCH", f"/pages/{page_id}", json=data)
+        page = self._request("PATCH", f"/pages/{page_id}", json=data)
+        with self._page_cache_lock:
+            key = self._page_keys.get(page_id)
+        if key is not None:
+            self._cache_page(*key, page)
+        return page
 
     def find_page_by_title(self, database_id: str, title: str) -> Optional[Dict[str, Any]]:
         """Find a page by title property.
@@ -127,12 +287,67 @@ class NotionAPI:
             database_id: Database ID
             title: Title to search for
         """
+        key = (database_id, title)
+        with self._page_cache_lock:
+            cached = self._page_cache.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
         filter_obj = {
             "property": "Name",
             "title": {"equals": title}
         }
         results = self.query_database(database_id, filter_obj=filter_obj)
-        return results[0] if results else None
+        if not results:
+            return None
+        self._cache_page(database_id, title, results[0])
+        return results[0]
+
+    def _cache_page(self, database_id: str, title: str, page: Dict[str, Any]) -> None:
+        """Remember the page for a title until PAGE_CACHE_TTL elapses."""
+        key = (database_id, title)
+        with self._page_cache_lock:
+            self._page_cache[key] = (page, time.monotonic() + self.PAGE_CACHE_TTL)
+            self._page_keys[page["id"]] = key
+
+    def snapshot_database(self, database_id: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch every page of a scorecard database in one paginated sweep.
+
+        Args:
+            database_id: Database ID
+
+        Returns:
+            Dict mapping lower-cased page title to {"id": page_id, "last_audit": iso_str or None}
+        """
+        snapshot = {}
+        for page in self.query_database(database_id):
+            title, summary = self.summarize_page(page)
+            if title:
+                snapshot[title.lower()] = summary
+        return snapshot
+
+    @staticmethod
+    def page_title(page: Dict[str, Any]) -> str:
+        """Plain-text value of a page's Name (title) property."""
+        return "".join(
+            t.get("plain_text", "")
+            for t in page.get("properties", {}).get("Name", {}).get("title", [])
+        )
+
+    @staticmethod
+    def summarize_page(page: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+        """Extract the title, page ID and Last Audit date from a scorecard page.
+
+        Args:
+            page: Page object returned by the Notion API
+
+        Returns:
+            Tuple of (title, {"id": page_id, "last_audit": iso_str or None})
+        """
+        properties = page.get("properties", {})
+        title = NotionAPI.page_title(page)
+        last_audit = (properties.get("Last Audit", {}).get("date") or {}).get("start")
+        return title, {"id": page["id"], "last_audit": last_audit}
 
     @staticmethod
     def property_text(value: str) -> Dict[str, Any]:
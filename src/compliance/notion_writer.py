@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Background Notion writer that decouples scorecard syncing from repository audits."""
+
+import queue
+import sys
+import threading
+from typing import Any, Callable, List, Optional
+
+# Queue marker telling a writer thread to exit
+_STOP = object()
+
+
+class NotionWriter:
+    """Drains audit results from a queue and syncs them to Notion on a few dedicated threads.
+
+    Audit workers never wait on Notion: ``main`` submits each finished result to the
+    writers. Rate limiting and 429 retries are left to ``NotionAPI``, which meters every
+    request the writers make through its shared limiter.
+    """
+
+    def __init__(self, sync: Callable[[Any], None], workers: int = 3):
+        """Start the writer threads.
+
+        Args:
+            sync: Function that writes one result to Notion (e.g. a bound ``sync_to_notion``)
+            workers: Number of writer threads
+        """
+        self._sync = sync
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self.failed: List[str] = []
+        self._failed_lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"notion-writer-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, result: Any) -> None:
+        """Queue a result for syncing."""
+        self._queue.put(result)
+
+    def close(self) -> None:
+        """Wait for every queued result to be written, then stop the writer threads."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._write(item)
+
+    def _write(self, result: Any) -> None:
+        try:
+            self._sync(result)
+        except Exception as e:
+            self._record_failure(result, e)
+
+    def _record_failure(self, result: Any, error: Optional[Exception]) -> None:
+        repo_name = getattr(result, "repo", "?")
+        with self._failed_lock:
+            self.failed.append(repo_name)
+        print(f"✗ Notion sync failed for {repo_name}: {error}", file=sys.stderr)
@@ -2,170 +2,415 @@
 """Helper script to create Notion databases for compliance tracking."""
 
 import argparse
+import hashlib
+import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
+import yaml
+
+from . import _json
+from .cache import DEFAULT_NOTION_DBS_PATH
 from .notion_api import NotionAPI
 
 
-def create_scorecard_database(notion_api: NotionAPI, parent_page_id: str) -> str:
-    """Create Repos Scorecard database.
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Property types Notion accepts when creating a database, and the colors a select option may use
+_PROPERTY_TYPES = frozenset({
+    "title", "rich_text", "number", "select", "multi_select", "status", "date", "people", "files",
+    "checkbox", "url", "email", "phone_number", "formula", "relation", "rollup", "created_time",
+    "created_by", "last_edited_time", "last_edited_by", "unique_id",
+})
+_OPTION_COLORS = frozenset(
+    {"default", "gray", "brown", "orange", "yellow", "green", "blue", "purple", "pink", "red"}
+)
+
+
+def validate_properties(properties: Mapping[str, Any]) -> None:
+    """Check a database property schema locally, before Notion rejects it with a 400.
 
     Args:
-        notion_api: Notion API client
-        parent_page_id: Parent page ID
+        properties: Property name -> {type: configuration}
 
-    Returns:
-        Database ID
+    Raises:
+        ValueError: If a property has an unknown type or a bad select option, or the
+            schema doesn't have exactly one title property
     """
-    properties = {
-        "Name": {"title": {}},
-        "Compliance Score": {"number": {}},
-        "Default Branch": {"rich_text": {}},
-        "Archived": {"checkbox": {}},
-        "Archived At": {"date": {}},
-        "Forked": {"checkbox": {}},
-        "Primary Language": {"rich_text": {}},
-        "Primary Contributor": {"rich_text": {}},
-        "Contributors Count": {"number": {}},
-        "Last Commit Date": {"date": {}},
-        "Time Since Last Commit": {"rich_text": {}},
-        "Last Audit": {"date": {}},
-        "Status": {
-            "select": {
-                "options": [
-                    {"name": "Compliant", "color": "green"},
-                    {"name": "Needs Attention", "color": "yellow"},
-                    {"name": "Non-Compliant", "color": "red"},
-                    {"name": "Exception", "color": "blue"},
-                ]
-            }
-        },
-        "Owner": {"rich_text": {}},
-        "Repository URL": {"url": {}},
+    titles = 0
+    for name, prop in properties.items():
+        if len(prop) != 1:
+            raise ValueError(f"Property {name!r} must have exactly one type, got {sorted(prop)}")
+        (prop_type, prop_config), = prop.items()
+        if prop_type not in _PROPERTY_TYPES:
+            raise ValueError(f"Property {name!r} has unknown type {prop_type!r}")
+        titles += prop_type == "title"
+        if prop_type in ("select", "multi_select"):
+            for option in prop_config.get("options", ()):
+                if not option.get("name"):
+                    raise ValueError(f"Property {name!r} has an option without a name")
+                if option.get("color", "default") not in _OPTION_COLORS:
+                    raise ValueError(
+                        f"Option {option['name']!r} of {name!r} "
+                        f"has unknown color {option['color']!r}"
+                    )
+    if titles != 1:
+        raise ValueError(f"Schema must have exactly one title property, got {titles}")
+
+
+# Color of each select option, shared by every database that offers the option
+_STATUS_COLORS: Dict[str, str] = {
+    "Compliant": "green",
+    "Needs Attention": "yellow",
+    "Non-Compliant": "red",
+    "Exception": "blue",
+    "Action Item": "yellow",
+    "Remediation": "orange",
+    "Open": "red",
+    "In Progress": "yellow",
+    "Resolved": "green",
+    "Approved": "blue",
+    "staging": "yellow",
+    "production": "green",
+    "development": "blue",
+}
+
+
+def _select(options: Iterable[str]) -> Dict[str, Any]:
+    """Select property with the given options, colored from _STATUS_COLORS."""
+    return {
+        "select": {"options": [{"name": name, "color": _STATUS_COLORS[name]} for name in options]}
     }
 
-    db = notion_api.create_database(parent_page_id, "Repos Scorecard", properties)
-    print(f"Created Repos Scorecard database: {db['id']}")
-    print(f"URL: {db.get('url', 'N/A')}")
-    return db["id"]
 
+# Property schemas, built once at import and read-only so callers can't alter them by accident
+_SCORECARD_PROPS: Mapping[str, Mapping[str, Any]] = _freeze({
+    "Name": {"title": {}},
+    "Compliance Score": {"number": {}},
+    "Default Branch": {"rich_text": {}},
+    "Archived": {"checkbox": {}},
+    "Archived At": {"date": {}},
+    "Forked": {"checkbox": {}},
+    "Primary Language": {"rich_text": {}},
+    "Primary Contributor": {"rich_text": {}},
+    "Contributors Count": {"number": {}},
+    "Last Commit Date": {"date": {}},
+    "Time Since Last Commit": {"rich_text": {}},
+    "Last Audit": {"date": {}},
+    "Status": _select(["Compliant", "Needs Attention", "Non-Compliant", "Exception"]),
+    "Owner": {"rich_text": {}},
+    "Repository URL": {"url": {}},
+})
+
+_ACTIONS_PROPS: Mapping[str, Mapping[str, Any]] = _freeze({
+    "Name": {"title": {}},
+    "Type": _select(["Exception", "Action Item", "Remediation"]),
+    "Repository": {"rich_text": {}},
+    "Status": _select(["Open", "In Progress", "Resolved", "Approved"]),
+    "Owner": {"rich_text": {}},
+    "Due Date": {"date": {}},
+    "Description": {"rich_text": {}},
+    "Created": {"created_time": {}},
+    "Updated": {"last_edited_time": {}},
+})
+
+_RELEASE_VIEWS_PROPS: Mapping[str, Mapping[str, Any]] = _freeze({
+    "Name": {"title": {}},
+    "Product Version": {"rich_text": {}},
+    "Repository": {"rich_text": {}},
+    "Tag": {"rich_text": {}},
+    "Commit SHA": {"rich_text": {}},
+    "Package Version": {"rich_text": {}},
+    "Environment": _select(["staging", "production", "development"]),
+    "Deployed At": {"date": {}},
+    "Last Updated": {"date": {}},
+})
 
-def create_actions_database(notion_api: NotionAPI, parent_page_id: str) -> str:
-    """Create Actions/Exceptions database.
+# (title, properties schema) of each database
+SCORECARD_DATABASE: Tuple[str, Mapping[str, Any]] = ("Repos Scorecard", _SCORECARD_PROPS)
+ACTIONS_DATABASE: Tuple[str, Mapping[str, Any]] = ("Actions & Exceptions", _ACTIONS_PROPS)
+RELEASE_VIEWS_DATABASE: Tuple[str, Mapping[str, Any]] = ("Release Views", _RELEASE_VIEWS_PROPS)
+
+# A typo in a schema fails the import rather than a round trip to Notion
+for _, _properties in (SCORECARD_DATABASE, ACTIONS_DATABASE, RELEASE_VIEWS_DATABASE):
+    validate_properties(_properties)
+
+# Placeholder for the parent page ID in the serialized request bodies
+_PARENT_PLACEHOLDER = _json.dumps("__PARENT_PAGE_ID__")
+
+# POST /databases bodies, serialized once at import; only the parent page ID is filled in per call
+_BODY_TEMPLATES: Dict[str, bytes] = {
+    title: _json.dumps({
+        "parent": {"page_id": "__PARENT_PAGE_ID__"},
+        "title": [{"text": {"content": title}}],
+        "properties": properties,
+    })
+    for title, properties in (SCORECARD_DATABASE, ACTIONS_DATABASE, RELEASE_VIEWS_DATABASE)
+}
+
+
+def database_body(database: Tuple[str, Mapping[str, Any]], parent_page_id: str) -> bytes:
+    """Request body that creates one of this module's databases under a page.
 
     Args:
-        notion_api: Notion API client
+        database: One of SCORECARD_DATABASE, ACTIONS_DATABASE or RELEASE_VIEWS_DATABASE
         parent_page_id: Parent page ID
 
     Returns:
-        Database ID
+        Serialized JSON body for ``NotionAPI.create_database_raw``
     """
-    properties = {
-        "Name": {"title": {}},
-        "Type": {
-            "select": {
-                "options": [
-                    {"name": "Exception", "color": "blue"},
-                    {"name": "Action Item", "color": "yellow"},
-                    {"name": "Remediation", "color": "orange"},
-                ]
-            }
-        },
-        "Repository": {"rich_text": {}},
-        "Status": {
-            "select": {
-                "options": [
-                    {"name": "Open", "color": "red"},
-                    {"name": "In Progress", "color": "yellow"},
-                    {"name": "Resolved", "color": "green"},
-                    {"name": "Approved", "color": "blue"},
-                ]
-            }
-        },
-        "Owner": {"rich_text": {}},
-        "Due Date": {"date": {}},
-        "Description": {"rich_text": {}},
-        "Created": {"created_time": {}},
-        "Updated": {"last_edited_time": {}},
-    }
+    return _BODY_TEMPLATES[database[0]].replace(_PARENT_PLACEHOLDER, _json.dumps(parent_page_id))
 
-    db = notion_api.create_database(parent_page_id, "Actions & Exceptions", properties)
-    print(f"Created Actions & Exceptions database: {db['id']}")
-    print(f"URL: {db.get('url', 'N/A')}")
-    return db["id"]
 
+# --only choice -> (label, key under "notion:" in config.yaml, database); iteration order
+# is the order they're reported in
+DATABASES: Dict[str, Tuple[str, str, Tuple[str, Mapping[str, Any]]]] = {
+    "scorecard": ("Scorecard", "scorecard_db_id", SCORECARD_DATABASE),
+    "actions": ("Actions", "actions_db_id", ACTIONS_DATABASE),
+    "release-views": ("Release Views", "release_views_db_id", RELEASE_VIEWS_DATABASE),
+}
 
-def create_release_views_database(notion_api: NotionAPI, parent_page_id: str) -> str:
-    """Create Release Views database.
+# An indented "key: value  # comment" line of a YAML mapping
+_CONFIG_ENTRY_RE = re.compile(
+    r"""^(?P<indent>[ \t]+)(?P<key>\w+):[ \t]*(?:"[^"]*"|'[^']*'|[^\s#]*)(?P<rest>.*)$"""
+)
+
+
+@lru_cache(maxsize=1)
+def _notion_api(token_fingerprint: str) -> NotionAPI:
+    return NotionAPI()
+
+
+def get_notion_api() -> NotionAPI:
+    """Return a Notion client for the current NOTION_TOKEN, reusing it across calls.
+
+    Long-running callers that provision databases repeatedly get the same client (and its
+    page cache) each time; a rotated token yields a new one.
+
+    Raises:
+        ValueError: If NOTION_TOKEN isn't set
+    """
+    token = os.getenv("NOTION_TOKEN", "")
+    return _notion_api(hashlib.blake2b(token.encode("utf-8"), digest_size=8).hexdigest())
+
+
+def _load_cache(path: Path) -> Dict[str, str]:
+    """Load the "<parent page ID>:<title>" -> database ID map of earlier runs."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path: Path, cache: Dict[str, str]) -> None:
+    """Write the database ID map, replacing the old file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def find_existing_database(
+    notion_api: NotionAPI, parent_page_id: str, title: str, cached_id: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Find a database created by an earlier run.
 
     Args:
         notion_api: Notion API client
         parent_page_id: Parent page ID
+        title: Database title
+        cached_id: Database ID recorded by an earlier run, confirmed with a single GET
 
     Returns:
-        Database ID
+        Existing database object, or None if it has to be created
     """
-    properties = {
-        "Name": {"title": {}},
-        "Product Version": {"rich_text": {}},
-        "Repository": {"rich_text": {}},
-        "Tag": {"rich_text": {}},
-        "Commit SHA": {"rich_text": {}},
-        "Package Version": {"rich_text": {}},
-        "Environment": {
-            "select": {
-                "options": [
-                    {"name": "staging", "color": "yellow"},
-                    {"name": "production", "color": "green"},
-                    {"name": "development", "color": "blue"},
-                ]
-            }
-        },
-        "Deployed At": {"date": {}},
-        "Last Updated": {"date": {}},
-    }
+    if cached_id:
+        db = notion_api.get_database(cached_id)
+        if db is not None:
+            return db
+    return notion_api.find_database(parent_page_id, title)
+
+
+def write_config(path: str, db_ids: Dict[str, str]) -> None:
+    """Set database IDs under ``notion:`` in a config.yaml, leaving everything else as is.
+
+    Existing entries are updated in place, keeping their trailing comments; missing ones
+    are added to the end of the ``notion:`` section, which is created if needed. Only keys
+    directly under ``notion:`` are touched. The result is re-parsed before it replaces the
+    file (atomically, so an interrupted write can't leave it truncated).
+
+    Args:
+        path: config.yaml path (created if it doesn't exist)
+        db_ids: Key under ``notion:`` (e.g. "scorecard_db_id") -> database ID
+
+    Raises:
+        ValueError: If ``notion:`` is written in flow style (``notion: {...}``), or the
+            edited file doesn't parse back to the new IDs; the file is left unchanged
+    """
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        lines = []
 
-    db = notion_api.create_database(parent_page_id, "Release Views", properties)
-    print(f"Created Release Views database: {db['id']}")
-    print(f"URL: {db.get('url', 'N/A')}")
-    return db["id"]
+    remaining = dict(db_ids)
+    indent = "  "
+    start = None
+    for i, line in enumerate(lines):
+        if re.match(r"notion:\s*(#.*)?$", line):
+            start = i
+            break
+        if re.match(r"notion:", line):
+            raise ValueError(f"{path}: the notion: section must be a block mapping, not {line!r}")
+
+    if start is None:
+        if lines and lines[-1].strip():
+            lines.append("")
+        lines.append("notion:")
+        end = len(lines)
+    else:
+        end = start + 1
+        section_indent = None
+        for i in range(start + 1, len(lines)):
+            line = lines[i]
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            if line[:1] not in (" ", "\t"):
+                break
+            end = i + 1
+            match = _CONFIG_ENTRY_RE.match(line)
+            if match is None:
+                continue
+            # The first entry sets the section's indent; deeper lines belong to nested mappings
+            if section_indent is None:
+                section_indent = indent = match["indent"]
+            if match["indent"] == section_indent and match["key"] in remaining:
+                key = match["key"]
+                lines[i] = f'{match["indent"]}{key}: "{remaining.pop(key)}"{match["rest"]}'
+    lines[end:end] = [f'{indent}{key}: "{db_id}"' for key, db_id in remaining.items()]
+    text = "\n".join(lines) + "\n"
+
+    try:
+        written = (yaml.safe_load(text) or {}).get("notion") or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"{path}: edited config doesn't parse: {e}") from e
+    wrong = sorted(key for key, db_id in db_ids.items() if written.get(key) != db_id)
+    if wrong:
+        raise ValueError(
+            f"{path}: edited config doesn't contain the new IDs for {', '.join(wrong)}"
+        )
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
 
 
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(description="Create Notion databases for compliance tracking")
     parser.add_argument("--parent-page-id", required=True, help="Notion parent page ID")
-    parser.add_argument("--scorecard-only", action="store_true", help="Create only scorecard database")
-    parser.add_argument("--actions-only", action="store_true", help="Create only actions database")
-    parser.add_argument("--release-views-only", action="store_true", help="Create only release views database")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=DATABASES,
+        default=list(DATABASES),
+        help="Create only these databases (default: all)",
+    )
+    # Older spellings of --only, kept so existing scripts keep working
+    for key in DATABASES:
+        parser.add_argument(f"--{key}-only", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--write-config", metavar="PATH", help="Also write the database IDs into this config.yaml"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Create new databases even if they already exist under the parent page",
+    )
 
     args = parser.parse_args()
 
     try:
-        notion_api = NotionAPI()
+        notion_api = get_notion_api()
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    created = []
+    only = [key for key in DATABASES if getattr(args, f"{key.replace('-', '_')}_only")] or args.only
+    selected = [DATABASES[key] for key in DATABASES if key in only]
+
+    # Reuse databases from earlier runs, so re-running doesn't leave duplicates behind
+    cache = _load_cache(DEFAULT_NOTION_DBS_PATH)
+    titles = [title for _, _, (title, _) in selected]
+    keys = [f"{args.parent_page_id}:{title}" for title in titles]
+    existing = [None] * len(selected)
+    if not args.force:
+        with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+            existing = list(
+                executor.map(
+                    lambda key, title: find_existing_database(
+                        notion_api, args.parent_page_id, title, cache.get(key)
+                    ),
+                    keys,
+                    titles,
+                )
+            )
 
-    if args.scorecard_only or (not args.actions_only and not args.release_views_only):
-        db_id = create_scorecard_database(notion_api, args.parent_page_id)
-        created.append(("Scorecard", db_id))
+    missing = [spec for (_, _, spec), db in zip(selected, existing) if db is None]
+    new_databases = iter(
+        notion_api.create_databases_raw(
+            [database_body(spec, args.parent_page_id) for spec in missing]
+        )
+    )
 
-    if args.actions_only or (not args.scorecard_only and not args.release_views_only):
-        db_id = create_actions_database(notion_api, args.parent_page_id)
-        created.append(("Actions", db_id))
+    # Status goes to stderr in one write once every request has finished, so stdout
+    # carries only the config block below and a slow log pipe never holds up a request
+    created = []
+    status = []
+    for (name, config_key, (title, _)), key, db in zip(selected, keys, existing):
+        if db is None:
+            db = next(new_databases)
+            status.append(f"Created {title} database: {db['id']}")
+        else:
+            status.append(f"Using existing {title} database: {db['id']}")
+        status.append(f"URL: {db.get('url', 'N/A')}")
+        cache[key] = db["id"]
+        created.append((name, config_key, db["id"]))
+    print("\n".join(status), file=sys.stderr)
 
-    if args.release_views_only or (not args.scorecard_only and not args.actions_only):
-        db_id = create_release_views_database(notion_api, args.parent_page_id)
-        created.append(("Release Views", db_id))
+    try:
+        _save_cache(DEFAULT_NOTION_DBS_PATH, cache)
+    except OSError as e:
+        print(f"Warning: could not save {DEFAULT_NOTION_DBS_PATH}: {e}", file=sys.stderr)
 
     print("\nDatabase IDs to add to config.yaml:")
-    for name, db_id in created:
+    for name, _, db_id in created:
         print(f"  {name}: {db_id}")
 
+    if args.write_config:
+        try:
+            write_config(args.write_config, {config_key: db_id for _, config_key, db_id in created})
+        except (OSError, ValueError) as e:
+            print(f"Error: could not update {args.write_config}: {e}", file=sys.stderr)
+            return 1
+        print(f"Updated {args.write_config}", file=sys.stderr)
+
     return 0
 
 
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""GitHub webhook receiver that keeps the Notion scorecard current between audit sweeps.
+
+Org webhook events update only the scorecard columns they affect, so the full
+``audit`` run can become a periodic reconciliation sweep instead of the main driver.
+"""
+
+import argparse
+import hashlib
+import hmac
+import os
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+from wsgiref.simple_server import make_server
+
+from . import _json
+from .audit import load_config
+from .checks import ComplianceChecker
+from .gh_api import GitHubAPI
+from .notion_api import NotionAPI
+from .notion_writer import NotionWriter
+
+# GitHub caps webhook payloads at 25 MB; anything larger isn't a real delivery
+MAX_BODY_BYTES = 25 * 1024 * 1024
+
+
+class _Delivery(NamedTuple):
+    """A verified delivery waiting to be applied to the scorecard."""
+
+    repo: str
+    handler: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+    payload: Dict[str, Any]
+
+
+def verify_signature(secret: bytes, body: bytes, signature: Optional[str]) -> bool:
+    """Check an ``X-Hub-Signature-256`` header against the request body.
+
+    Args:
+        secret: Webhook secret configured on the GitHub org
+        body: Raw request body
+        signature: Header value ("sha256=<hex digest>"), or None if missing
+
+    Returns:
+        True if the signature matches
+    """
+    if not signature:
+        return False
+    expected = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+class WebhookApp:
+    """WSGI application that applies org webhook events to the scorecard database.
+
+    Handled events:
+        push: Refreshes Last Commit Date / Time Since Last Commit on default-branch pushes
+        repository: Updates Archived on (un)archive and Default Branch on edits
+
+    Deliveries are verified and acknowledged with 202 straight away, then applied in
+    order on a background writer thread, so a slow GitHub or Notion call (e.g. waiting
+    out a 429) never holds a response past GitHub's 10 second delivery timeout.
+
+    Other events (e.g. ``pull_request``, ``workflow_run``) are acknowledged and ignored;
+    they don't change any scorecard column. Pages created after start-up are looked up
+    by title on first use; repositories with no page at all are left for the next audit
+    sweep to create.
+    """
+
+    def __init__(
+        self,
+        secret: bytes,
+        gh_api: GitHubAPI,
+        notion_api: NotionAPI,
+        database_id: str,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the receiver and load the repo -> page mapping.
+
+        Args:
+            secret: Webhook secret used to verify ``X-Hub-Signature-256``
+            gh_api: GitHub API client
+            notion_api: Notion API client
+            database_id: Scorecard database ID
+            config: Configuration dict (as loaded by ``load_config``)
+        """
+        self.secret = secret
+        self.gh_api = gh_api
+        self.notion_api = notion_api
+        self.database_id = database_id
+        self.config = config or {}
+        # Lower-cased repo name -> scorecard page ID, from one sweep of the database
+        self.pages: Dict[str, str] = {
+            title: summary["id"]
+            for title, summary in notion_api.snapshot_database(database_id).items()
+        }
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+            "push": self.on_push,
+            "repository": self.on_repository,
+        }
+        # One thread, so events for a repository are applied in the order they arrived
+        self.writer = NotionWriter(self._apply, workers=1)
+
+    def close(self) -> None:
+        """Apply every delivery already accepted, then stop the writer thread."""
+        self.writer.close()
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        if environ.get("REQUEST_METHOD") != "POST":
+            return self._respond(start_response, "405 Method Not Allowed", b"POST only\n")
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length > MAX_BODY_BYTES:
+            return self._respond(start_response, "413 Payload Too Large", b"Payload too large\n")
+        body = environ["wsgi.input"].read(length)
+
+        if not verify_signature(self.secret, body, environ.get("HTTP_X_HUB_SIGNATURE_256")):
+            return self._respond(start_response, "401 Unauthorized", b"Bad signature\n")
+
+        handler = self._handlers.get(environ.get("HTTP_X_GITHUB_EVENT", ""))
+        if handler is None:
+            return self._respond(start_response, "204 No Content", b"")
+
+        try:
+            payload = _json.loads(body)
+        except ValueError:
+            return self._respond(start_response, "400 Bad Request", b"Invalid JSON\n")
+
+        if not isinstance(payload, dict):
+            return self._respond(start_response, "400 Bad Request", b"Expected a JSON object\n")
+
+        repo_name = (payload.get("repository") or {}).get("full_name", "")
+        self.writer.submit(_Delivery(repo_name, handler, payload))
+        return self._respond(start_response, "202 Accepted", b"")
+
+    def _apply(self, delivery: _Delivery) -> None:
+        """Run a delivery's handler and write the resulting columns (writer thread)."""
+        properties = delivery.handler(delivery.payload)
+        if properties:
+            self.update_scorecard(delivery.repo, properties)
+
+    @staticmethod
+    def _respond(start_response: Callable, status: str, body: bytes) -> List[bytes]:
+        start_response(status, [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))])
+        return [body]
+
+    def update_scorecard(self, repo_name: str, properties: Dict[str, Any]) -> bool:
+        """Patch a repository's scorecard page with the given properties.
+
+        Args:
+            repo_name: Repository full name (org/repo)
+            properties: Notion properties to set
+
+        Returns:
+            True if the repository has a page and it was updated
+        """
+        page_id = self.pages.get(repo_name.lower())
+        if page_id is None:
+            # Possibly created by an audit run since start-up
+            page = self.notion_api.find_page_by_title(self.database_id, repo_name)
+            if page is None:
+                return False
+            page_id = self.pages[repo_name.lower()] = page["id"]
+        self.notion_api.update_page(page_id, properties)
+        print(f"✓ Updated {repo_name}: {', '.join(properties)}", file=sys.stderr)
+        return True
+
+    def on_push(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Refresh the last-commit columns after a push to the default branch."""
+        repository = payload.get("repository") or {}
+        default_branch = repository.get("default_branch")
+        if not default_branch or payload.get("ref") != f"refs/heads/{default_branch}":
+            return None
+
+        latest_commit = self.gh_api.get_latest_commit(repository["full_name"], default_branch)
+        date_str = ((latest_commit or {}).get("commit", {}).get("author") or {}).get("date")
+        if not date_str:
+            return None
+
+        last_commit_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        # A fresh checker, so "now" is the time of this event rather than a cached one
+        time_since = ComplianceChecker(self.gh_api, self.config).humanize_time_since(
+            last_commit_date
+        )
+        return {
+            "Last Commit Date": NotionAPI.property_date(last_commit_date),
+            "Time Since Last Commit": NotionAPI.property_rich_text(time_since),
+        }
+
+    def on_repository(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Mirror archive state and default-branch changes."""
+        action = payload.get("action")
+        repository = payload.get("repository") or {}
+        if action in ("archived", "unarchived"):
+            return {"Archived": NotionAPI.property_checkbox(action == "archived")}
+        if action == "edited" and "default_branch" in (payload.get("changes") or {}):
+            return {
+                "Default Branch": NotionAPI.property_rich_text(repository.get("default_branch", ""))
+            }
+        return None
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Receive GitHub org webhooks and update the Notion scorecard"
+    )
+    parser.add_argument("--config", help="Path to config.yaml file")
+    parser.add_argument("--org", help="GitHub organization (overrides config/env)")
+    parser.add_argument("--notion-db", help="Notion database ID for scorecard")
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (default: 127.0.0.1; expose it through a reverse proxy)",
+    )
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+
+    args = parser.parse_args()
+
+    secret = os.getenv("GITHUB_WEBHOOK_SECRET")
+    if not secret:
+        print("Error: GITHUB_WEBHOOK_SECRET env var required", file=sys.stderr)
+        return 1
+
+    config = load_config(args.config)
+    scorecard_db_id = args.notion_db or config.get("notion", {}).get("scorecard_db_id")
+    if not scorecard_db_id:
+        print(
+            "Error: Notion scorecard database ID required (--notion-db or config)", file=sys.stderr
+        )
+        return 1
+
+    try:
+        gh_api = GitHubAPI(org=args.org or config.get("github_org"))
+        notion_api = NotionAPI()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    app = WebhookApp(secret.encode("utf-8"), gh_api, notion_api, scorecard_db_id, config)
+    print(
+        f"Loaded {len(app.pages)} scorecard pages; listening on {args.host}:{args.port}",
+        file=sys.stderr,
+    )
+
+    with make_server(args.host, args.port, app) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            app.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())